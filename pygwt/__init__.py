@@ -1,6 +1,40 @@
-"""Top-level package for pygwt utilities."""
+"""Top-level package for pygwt utilities.
 
-from .parser import GwtParser
-from . import models, utils
+Submodules and their public names are imported on first attribute access so
+``import pygwt`` stays cheap for short-lived processes.
+"""
 
-__all__ = ["GwtParser", "models", "utils"]
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .exceptions import GwtRemoteException
+    from .parser import GwtParser
+    from .utils import peek_status
+    from . import models, utils
+
+# public name -> (submodule, attribute); ``None`` exports the submodule itself
+_LAZY = {
+    "GwtParser": ("parser", "GwtParser"),
+    "GwtRemoteException": ("exceptions", "GwtRemoteException"),
+    "peek_status": ("utils", "peek_status"),
+    "models": ("models", None),
+    "utils": ("utils", None),
+}
+
+__all__ = ["GwtParser", "GwtRemoteException", "models", "peek_status", "utils"]
+
+
+def __getattr__(name):
+    try:
+        module_name, attribute = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    module = import_module(f".{module_name}", __name__)
+    value = module if attribute is None else getattr(module, attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,90 @@
+"""Read captured responses straight out of compressed archives.
+
+Supported inputs are single ``.gz``/``.bz2``/``.xz``/``.zst`` files, tarballs
+(``.tar`` optionally compressed with any of those, plus ``.tgz``/``.tzst``) and
+``.zip`` files. Tarballs are read in streaming mode and every format yields
+one member at a time, so only the member being decoded is held in memory.
+``.zst`` support needs the optional ``zstandard`` package.
+"""
+
+from __future__ import annotations
+
+import bz2
+import gzip
+import lzma
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import IO, Any, Iterator
+
+from pygwt.parser import GwtParser
+
+COMPRESSED_SUFFIXES = (".gz", ".tgz", ".bz2", ".xz", ".zst", ".tzst")
+ARCHIVE_SUFFIXES = COMPRESSED_SUFFIXES + (".tar", ".zip")
+
+
+def is_archive(path: str | Path) -> bool:
+    """Return whether *path* looks like an archive :func:`iter_members` can read."""
+
+    return Path(path).name.lower().endswith(ARCHIVE_SUFFIXES)
+
+
+def _open_zstd(path: Path) -> IO[bytes]:
+    try:
+        import zstandard
+    except ImportError as exc:
+        raise RuntimeError("reading .zst archives requires the 'zstandard' package") from exc
+    return zstandard.ZstdDecompressor().stream_reader(open(path, "rb"), closefd=True)
+
+
+def _open_stream(path: Path) -> IO[bytes]:
+    """Open *path* as a decompressed binary stream."""
+
+    name = path.name.lower()
+    if name.endswith((".gz", ".tgz")):
+        return gzip.open(path, "rb")
+    if name.endswith(".bz2"):
+        return bz2.open(path, "rb")
+    if name.endswith(".xz"):
+        return lzma.open(path, "rb")
+    if name.endswith((".zst", ".tzst")):
+        return _open_zstd(path)
+    return open(path, "rb")
+
+
+def _is_tar(name: str) -> bool:
+    return name.endswith((".tar", ".tgz", ".tzst")) or ".tar." in name
+
+
+def iter_members(path: str | Path) -> Iterator[tuple[str, bytes]]:
+    """Yield ``(member_name, data)`` for every regular file in the archive.
+
+    A single compressed file yields one member named after the file without
+    its compression suffix.
+    """
+
+    path = Path(path)
+    name = path.name.lower()
+    if name.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            for info in archive.infolist():
+                if not info.is_dir():
+                    yield info.filename, archive.read(info)
+    elif _is_tar(name):
+        with _open_stream(path) as stream, tarfile.open(fileobj=stream, mode="r|") as archive:
+            for info in archive:
+                if info.isfile():
+                    yield info.name, archive.extractfile(info).read()
+    else:
+        with _open_stream(path) as stream:
+            yield path.stem, stream.read()
+
+
+def parse_archive(
+    path: str | Path, gwt_models: dict[str, type] | None = None, prescan: bool = False
+) -> Iterator[tuple[str, Any]]:
+    """Decode every member of an archive, yielding ``(member_name, result)``."""
+
+    for member, data in iter_members(path):
+        parser = GwtParser(data.decode("utf-8"), gwt_models, prescan=prescan)
+        yield member, parser.parse()
@@ -0,0 +1,358 @@
+"""Command-line entry point for bulk decoding of captured GWT responses.
+
+Example::
+
+    pygwt decode tests/gwt_examples --models tests.conftest --jobs 4 -o out.ndjson
+
+``--models`` accepts either ``package.module`` (every Pydantic model defined in
+the module is registered under its class name) or ``package.module:mapping``
+pointing to a ``{java_name: model}`` dictionary.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from pygwt.decode import decode_file, init_worker, iter_items, iter_sources, load_registry
+FORMATS = ("ndjson", "csv", "parquet")
+# Values of ``pygwt.gwt_codes.Endpoint``; spelled out so ``decode`` never imports requests.
+ENDPOINTS = ("sifmConsulta", "rfi")
+
+
+def _rows(record: dict[str, Any]) -> Iterator[dict[str, Any]]:
+    """Flatten a decoded record into one row per top-level item."""
+
+    result = record.get("result")
+    items = result if isinstance(result, list) else [result]
+    for item in items:
+        row = {"source": record["source"]}
+        if isinstance(item, dict):
+            for key, value in item.items():
+                row[key] = json.dumps(value) if isinstance(value, (dict, list)) else value
+        else:
+            row["value"] = json.dumps(item) if isinstance(item, (dict, list)) else item
+        yield row
+
+
+class NdjsonSink:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, record: dict[str, Any]) -> None:
+        self.stream.write(json.dumps(record, ensure_ascii=False))
+        self.stream.write("\n")
+
+    def close(self) -> None:
+        self.stream.flush()
+
+
+class SchemaMismatch(ValueError):
+    """Rows with another column set cannot be split off when writing to stdout."""
+
+
+def _schema_path(output: str, index: int) -> str:
+    """``out.csv`` for the first column set, then ``out-2.csv``, ``out-3.csv``..."""
+
+    if index == 0:
+        return output
+    path = Path(output)
+    return str(path.with_name(f"{path.stem}-{index + 1}{path.suffix}"))
+
+
+class CsvSink:
+    """Write rows as CSV, one file per distinct column set (one per result type).
+
+    The first column set goes to *output* and later ones to numbered siblings
+    (see :func:`_schema_path`). On stdout a second column set is an error.
+    """
+
+    def __init__(self, output: str | None):
+        self.output = output
+        self.writers: dict[frozenset[str], csv.DictWriter] = {}
+        self.paths: list[str] = []
+        self.streams = []
+
+    def _writer(self, row: dict[str, Any]) -> csv.DictWriter:
+        key = frozenset(row)
+        writer = self.writers.get(key)
+        if writer is None:
+            if self.output is None:
+                if self.writers:
+                    raise SchemaMismatch(
+                        f"{row['source']}: columns {sorted(row)} differ from the first row; "
+                        "csv on stdout holds a single result type, use --output or ndjson"
+                    )
+                stream = sys.stdout
+            else:
+                path = _schema_path(self.output, len(self.writers))
+                stream = open(path, "w", encoding="utf-8", newline="")
+                self.paths.append(path)
+                self.streams.append(stream)
+            writer = self.writers[key] = csv.DictWriter(stream, fieldnames=list(row))
+            writer.writeheader()
+        return writer
+
+    def write(self, record: dict[str, Any]) -> None:
+        if "error" in record:
+            return
+        for row in _rows(record):
+            self._writer(row).writerow(row)
+
+    def close(self) -> None:
+        sys.stdout.flush()
+        for stream in self.streams:
+            stream.close()
+
+
+class ParquetSink:
+    """Write rows in batches, one file per distinct column set, as string columns.
+
+    Files are named like :class:`CsvSink` outputs.
+    """
+
+    batch_size = 10_000
+
+    def __init__(self, path: str):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as exc:
+            raise RuntimeError("parquet output requires the 'pyarrow' package") from exc
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        self.path = path
+        self.paths: list[str] = []
+        # column set -> (columns in first-seen order, pending rows)
+        self.parts: dict[frozenset[str], tuple[list[str], list[dict[str, Any]]]] = {}
+        self.writers: dict[frozenset[str], Any] = {}
+
+    def write(self, record: dict[str, Any]) -> None:
+        if "error" in record:
+            return
+        for row in _rows(record):
+            key = frozenset(row)
+            part = self.parts.get(key)
+            if part is None:
+                part = self.parts[key] = (list(row), [])
+                self.paths.append(_schema_path(self.path, len(self.paths)))
+            columns, batch = part
+            batch.append({k: None if row[k] is None else str(row[k]) for k in columns})
+            if len(batch) >= self.batch_size:
+                self._flush(key)
+
+    def _flush(self, key: frozenset[str]) -> None:
+        columns, batch = self.parts[key]
+        if not batch:
+            return
+        schema = self.pa.schema([(column, self.pa.string()) for column in columns])
+        table = self.pa.Table.from_pylist(batch, schema=schema)
+        writer = self.writers.get(key)
+        if writer is None:
+            path = self.paths[list(self.parts).index(key)]
+            writer = self.writers[key] = self.pq.ParquetWriter(path, schema)
+        writer.write_table(table)
+        batch.clear()
+
+    def close(self) -> None:
+        for key in self.parts:
+            self._flush(key)
+        for writer in self.writers.values():
+            writer.close()
+
+
+def _open_sink(fmt: str, output: str | None):
+    to_stdout = not output or output == "-"
+    if fmt == "parquet":
+        if to_stdout:
+            raise SystemExit("parquet output requires --output")
+        return ParquetSink(output), None
+    if fmt == "csv":
+        return CsvSink(None if to_stdout else output), None
+    stream = sys.stdout if to_stdout else open(output, "w", encoding="utf-8", newline="")
+    return NdjsonSink(stream), stream if stream is not sys.stdout else None
+
+
+def decode_command(args: argparse.Namespace) -> int:
+    fmt = args.format
+    if fmt is None:
+        suffix = Path(args.output).suffix.lstrip(".") if args.output else ""
+        fmt = suffix if suffix in FORMATS else "ndjson"
+
+    sources = iter_items(iter_sources(args.inputs))
+    sink, stream = _open_sink(fmt, args.output)
+    files = errors = size = 0
+    start = time.perf_counter()
+    try:
+        if args.jobs > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=args.jobs, initializer=init_worker, initargs=(args.models,)
+            )
+            with executor:
+                for record in _bounded_map(executor, decode_file, sources, args.jobs * 4):
+                    files, errors, size = _consume(sink, record, files, errors, size)
+        else:
+            init_worker(args.models)
+            for record in map(decode_file, sources):
+                files, errors, size = _consume(sink, record, files, errors, size)
+    except (FileNotFoundError, SchemaMismatch) as exc:
+        raise SystemExit(f"pygwt decode: {exc}") from exc
+    finally:
+        sink.close()
+        if stream is not None:
+            stream.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"decoded {files} files ({errors} errors), {size / 1e6:.2f} MB in {elapsed:.2f}s: "
+        f"{files / elapsed if elapsed else 0:.1f} files/s, "
+        f"{size / 1e6 / elapsed if elapsed else 0:.2f} MB/s",
+        file=sys.stderr,
+    )
+    if len(getattr(sink, "paths", ())) > 1:
+        print(f"results had {len(sink.paths)} column sets: {', '.join(sink.paths)}", file=sys.stderr)
+    return 1 if errors else 0
+
+
+def _bounded_map(executor, func, items: Iterable, window: int) -> Iterator:
+    """Like ``executor.map`` but keeps at most *window* tasks in flight, in order."""
+
+    pending = deque()
+    for item in items:
+        pending.append(executor.submit(func, item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def _consume(sink, record, files, errors, size):
+    sink.write(record)
+    if "error" in record:
+        print(f"{record['source']}: {record['error']}", file=sys.stderr)
+        errors += 1
+    return files + 1, errors, size + record["size"]
+
+
+def ingest_command(args: argparse.Namespace) -> int:
+    from pygwt.ingest import CheckpointError, Ingestor
+
+    try:
+        ingestor = Ingestor(
+            args.directory,
+            args.output,
+            args.checkpoint or f"{args.output}.checkpoint",
+            models=args.models,
+            jobs=args.jobs,
+            pattern=args.pattern,
+            poll_interval=args.poll_interval,
+        )
+    except CheckpointError as exc:
+        raise SystemExit(f"pygwt ingest: {exc}") from exc
+    try:
+        ingestor.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        ingestor.close()
+    return 0
+
+
+def replay_command(args: argparse.Namespace) -> int:
+    from pygwt.replay import ReplayServer
+
+    server = ReplayServer(
+        args.corpus,
+        host=args.host,
+        port=args.port,
+        latency_ms=args.latency_ms,
+        jitter_ms=args.jitter_ms,
+        error_rate=args.error_rate,
+        synthetic_ratio=args.synthetic_ratio,
+        synthetic_sizes=tuple(args.synthetic_sizes),
+        seed=args.seed,
+    )
+    print(f"serving on {server.url}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+def loadtest_command(args: argparse.Namespace) -> int:
+    from pygwt.gwt_codes import Endpoint
+    from pygwt.replay import run_load
+
+    report = run_load(
+        args.url.rstrip("/"),
+        Endpoint(args.endpoint),
+        requests_total=args.requests,
+        concurrency=args.concurrency,
+        gwt_models=load_registry(args.models),
+    )
+    print(report)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="pygwt")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    decode = commands.add_parser("decode", help="decode raw GWT-RPC responses")
+    decode.add_argument("inputs", nargs="+", help="files, archives, directories or glob patterns")
+    decode.add_argument("-m", "--models", help="registry as 'module' or 'module:mapping'")
+    decode.add_argument("-o", "--output", help="output file, '-' or omitted for stdout")
+    decode.add_argument("-f", "--format", choices=FORMATS, help="defaults to the output suffix or ndjson; csv and parquet "
+                        "write one file per result type (out.csv, out-2.csv, ...)")
+    decode.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    decode.set_defaults(func=decode_command)
+
+    ingest = commands.add_parser("ingest", help="decode files as they arrive in a directory")
+    ingest.add_argument("directory", help="directory the capture proxy writes to")
+    ingest.add_argument("-o", "--output", required=True, help="NDJSON file records are appended to")
+    ingest.add_argument("-c", "--checkpoint", help="checkpoint file, defaults to OUTPUT.checkpoint")
+    ingest.add_argument("-m", "--models", help="registry as 'module' or 'module:mapping'")
+    ingest.add_argument("-j", "--jobs", type=int, default=1, help="worker processes")
+    ingest.add_argument("--pattern", default="*", help="only ingest file names matching this glob")
+    ingest.add_argument("--poll-interval", type=float, default=1.0, help="seconds between directory scans without inotify")
+    ingest.set_defaults(func=ingest_command)
+
+    replay = commands.add_parser("replay", help="serve captured responses locally for load tests")
+    replay.add_argument("corpus", nargs="?", help="directory of captured responses; synthetic only if omitted")
+    replay.add_argument("--host", default="127.0.0.1")
+    replay.add_argument("--port", type=int, default=8080)
+    replay.add_argument("--latency-ms", type=float, default=0.0)
+    replay.add_argument("--jitter-ms", type=float, default=0.0)
+    replay.add_argument("--error-rate", type=float, default=0.0, help="share of calls answered with //EX")
+    replay.add_argument("--synthetic-ratio", type=float, default=0.0, help="share of calls answered with synthetic responses")
+    replay.add_argument("--synthetic-sizes", type=int, nargs="+", default=[10, 100, 1000])
+    replay.add_argument("--seed", type=int)
+    replay.set_defaults(func=replay_command)
+
+    load = commands.add_parser("loadtest", help="drive GwtCodes and GwtParser against a server")
+    load.add_argument("url", help="base URL, e.g. http://127.0.0.1:8080")
+    load.add_argument("-m", "--models", help="registry as 'module' or 'module:mapping'")
+    load.add_argument("-e", "--endpoint", choices=ENDPOINTS, default=ENDPOINTS[0])
+    load.add_argument("-n", "--requests", type=int, default=1000)
+    load.add_argument("-c", "--concurrency", type=int, default=8)
+    load.set_defaults(func=loadtest_command)
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,93 @@
+"""Decode captured responses on worker processes.
+
+Shared by ``pygwt decode`` and :class:`~pygwt.ingest.Ingestor`. Only the parser
+and archive readers are imported here, so workers never load the HTTP client.
+"""
+
+from __future__ import annotations
+
+import glob
+import importlib
+import inspect
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from pydantic import BaseModel
+from pydantic_core import to_jsonable_python
+
+from pygwt.archive import is_archive, iter_members
+from pygwt.parser import GwtParser
+
+_worker_models: dict[str, type] | None = None
+
+
+def load_registry(path: str | None) -> dict[str, type]:
+    """Import the model registry described by *path*."""
+
+    if not path:
+        return {}
+    module_name, _, attribute = path.partition(":")
+    module = importlib.import_module(module_name)
+    if attribute:
+        registry = getattr(module, attribute)
+        return dict(registry() if callable(registry) else registry)
+    return {
+        name: obj
+        for name, obj in vars(module).items()
+        if inspect.isclass(obj)
+        and issubclass(obj, BaseModel)
+        and obj.__module__ == module.__name__
+    }
+
+
+def iter_sources(patterns: Iterable[str]) -> Iterator[Path]:
+    """Expand files, directories and glob patterns into response files."""
+
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            yield from sorted(p for p in path.rglob("*") if p.is_file())
+        elif path.is_file():
+            yield path
+        else:
+            matches = sorted(glob.glob(pattern, recursive=True))
+            if not matches:
+                raise FileNotFoundError(f"no files match {pattern!r}")
+            yield from (Path(match) for match in matches if Path(match).is_file())
+
+
+def init_worker(models_path: str | None) -> None:
+    """Load the model registry used by :func:`decode_file` in this process."""
+
+    global _worker_models
+    _worker_models = load_registry(models_path)
+
+
+def iter_items(paths: Iterable[Path]) -> Iterator[Path | tuple[str, bytes]]:
+    """Pass plain files through and expand archives into ``(source, data)`` members."""
+
+    for path in paths:
+        if is_archive(path):
+            for member, data in iter_members(path):
+                yield f"{path}/{member}", data
+        else:
+            yield path
+
+
+def decode_file(item: Path | tuple[str, bytes]) -> dict[str, Any]:
+    """Decode a single file or archive member into a JSON-ready record."""
+
+    source = item[0] if isinstance(item, tuple) else str(item)
+    record = {"source": source, "size": 0}
+    try:
+        if isinstance(item, tuple):
+            record["size"] = len(item[1])
+            text = item[1].decode("utf-8")
+        else:
+            record["size"] = item.stat().st_size
+            text = item.read_text(encoding="utf-8")
+        result = GwtParser(text, _worker_models).parse()
+        record["result"] = to_jsonable_python(result)
+    except Exception as exc:  # keep going: one bad capture must not stop a backfill
+        record["error"] = f"{type(exc).__name__}: {exc}"
+    return record
@@ -0,0 +1,18 @@
+class GwtRemoteException(Exception):
+    """Java exception returned by the service in an ``//EX`` response."""
+
+    def __init__(self, java_class: str, message: str | None = None, cause: "GwtRemoteException | None" = None):
+        super().__init__(f"{java_class}: {message}" if message else java_class)
+        self.java_class = java_class
+        self.message = message
+        self.cause = cause
+        self.__cause__ = cause
+
+    def chain(self) -> list["GwtRemoteException"]:
+        """Return this exception followed by its causes, outermost first."""
+
+        chain, current = [], self
+        while current is not None:
+            chain.append(current)
+            current = current.cause
+        return chain
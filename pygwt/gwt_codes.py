@@ -28,11 +28,15 @@ class Endpoint(str, Enum):
     rfi = "rfi"
 
 
+BASE_URL = "https://www4.sii.cl"
+
+
 class GwtCodes(ABC):
 
-    def __init__(self, endpoint: Endpoint):
+    def __init__(self, endpoint: Endpoint, base_url: str = BASE_URL):
         self.browser = "safari"
         self.endpoint = endpoint
+        self.base_url = base_url
         self.updated_at = time.time()
         self._gwt_permutation = self.get_gwt_permutation()
         self._strong_name = self.get_strong_name()
@@ -60,7 +64,7 @@ class GwtCodes(ABC):
 
     def get_gwt_permutation(self):
         """Fetch the current permutation token used by the GWT frontend."""
-        url = f'https://www4.sii.cl/{self.endpoint}Internet/{self.endpoint}.nocache.js'
+        url = f'{self.base_url}/{self.endpoint}Internet/{self.endpoint}.nocache.js'
         r = requests.get(url, headers=HEADERS)
         text = r.text
         browser_var = re.findall(rf"(\w+)='{self.browser}'", text)[0]
@@ -75,12 +79,12 @@ class GwtCodes(ABC):
 
 class SifmConsulta(GwtCodes):
 
-    def __init__(self):
-        super(SifmConsulta, self).__init__(endpoint=Endpoint.sifm_consulta.value)
+    def __init__(self, base_url: str = BASE_URL):
+        super(SifmConsulta, self).__init__(endpoint=Endpoint.sifm_consulta.value, base_url=base_url)
 
     def get_strong_name(self):
         """Retrieve the strong name for the ``sifmConsulta`` service."""
-        url = f"https://www4.sii.cl/{self.endpoint}Internet/{self.gwt_permutation}.cache.html"
+        url = f"{self.base_url}/{self.endpoint}Internet/{self.gwt_permutation}.cache.html"
         r = requests.get(url, headers=HEADERS)
         text = r.text
         browser_var = re.findall(r"(\w+)='svcConsulta'", text)[0]
@@ -90,12 +94,12 @@ class SifmConsulta(GwtCodes):
 
 class Rfi(GwtCodes):
 
-    def __init__(self):
-        super(Rfi, self).__init__(endpoint=Endpoint.rfi.value)
+    def __init__(self, base_url: str = BASE_URL):
+        super(Rfi, self).__init__(endpoint=Endpoint.rfi.value, base_url=base_url)
 
     def get_strong_name(self):
         """Retrieve the strong name for the ``rfi`` service."""
-        url = f"https://www4.sii.cl/{self.endpoint}Internet/{self.gwt_permutation}.cache.html"
+        url = f"{self.base_url}/{self.endpoint}Internet/{self.gwt_permutation}.cache.html"
         r = requests.get(url, headers=HEADERS)
         text = r.text
         pattern = r"'formularioFacade','([A-Z0-9]{32})'"
@@ -0,0 +1,242 @@
+"""Long-running ingest of responses dropped into a directory.
+
+:class:`Ingestor` watches a directory (inotify on Linux, polling elsewhere),
+decodes new files on a worker pool and appends one NDJSON record per file to
+the output. A new checkpoint file starts with the output's size at that
+point, and every written record is followed by a checkpoint line holding the
+output size after it, both fsync'ed. On restart the output is truncated back
+to the last checkpointed size, so a record is never written twice and files
+already checkpointed are never parsed again.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import fnmatch
+import json
+import os
+import select
+import struct
+import sys
+import threading
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+from pygwt.decode import decode_file, init_worker
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_TO = 0x00000080
+IN_Q_OVERFLOW = 0x00004000
+_EVENT = struct.Struct("iIII")
+
+
+class CheckpointError(RuntimeError):
+    """The output no longer matches its checkpoint."""
+
+
+class Checkpoint:
+    """Append-only log of ``<output size>\\t<source>`` lines.
+
+    A new log starts with a header line holding *start* and no source, so
+    there is always an offset to truncate the output back to.
+    """
+
+    def __init__(self, path: str | Path, start: int = 0):
+        self.path = Path(path)
+        self.done: set[str] = set()
+        self.offset: int | None = None
+        if self.path.exists():
+            complete = 0  # bytes up to the end of the last complete line
+            with open(self.path, "rb+") as file:
+                for line in file:
+                    if not line.endswith(b"\n"):
+                        break  # torn write from a crash
+                    offset, source = line[:-1].decode("utf-8").split("\t", 1)
+                    if source:
+                        self.done.add(source)
+                    self.offset = int(offset)
+                    complete += len(line)
+                file.truncate(complete)
+        self.file = open(self.path, "a", encoding="utf-8")
+        if self.offset is None:
+            self.commit("", start)
+
+    def commit(self, source: str, offset: int) -> None:
+        self.file.write(f"{offset}\t{source}\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        if source:
+            self.done.add(source)
+        self.offset = offset
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class _Inotify:
+    def __init__(self, directory: Path):
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        if libc.inotify_add_watch(self.fd, os.fsencode(directory), IN_CLOSE_WRITE | IN_MOVED_TO) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), "inotify_add_watch failed")
+        self.overflowed = False
+
+    def read(self, timeout: float) -> list[str]:
+        """Return names from pending events; sets ``overflowed`` if the kernel dropped some."""
+
+        if not select.select([self.fd], [], [], timeout)[0]:
+            return []
+        data = os.read(self.fd, 64 * 1024)
+        names, pos = [], 0
+        while pos < len(data):
+            _wd, mask, _cookie, length = _EVENT.unpack_from(data, pos)
+            pos += _EVENT.size
+            if mask & IN_Q_OVERFLOW:
+                self.overflowed = True
+            elif length:
+                names.append(os.fsdecode(data[pos:pos + length].rstrip(b"\0")))
+            pos += length
+        return names
+
+    def close(self) -> None:
+        os.close(self.fd)
+
+
+class DirectoryWatcher:
+    """Report files that appear in *directory* and match *pattern*.
+
+    Uses inotify (``IN_CLOSE_WRITE``/``IN_MOVED_TO``) when available. The
+    polling fallback only reports files left untouched for ``settle`` seconds
+    so that half-written captures are not picked up. When the inotify queue
+    overflows, the directory is rescanned the same way until no unseen file is
+    left waiting to settle.
+    """
+
+    def __init__(self, directory: str | Path, pattern: str = "*", poll_interval: float = 1.0,
+                 settle: float | None = None, use_inotify: bool = True):
+        self.directory = Path(directory)
+        self.pattern = pattern
+        self.poll_interval = poll_interval
+        self.settle = poll_interval if settle is None else settle
+        self.seen: set[str] = set()
+        self.rescan = False
+        self.inotify = None
+        if use_inotify and sys.platform.startswith("linux"):
+            try:
+                self.inotify = _Inotify(self.directory)
+            except OSError:
+                self.inotify = None
+
+    def existing(self) -> list[Path]:
+        """Return matching files already in the directory, oldest name first."""
+
+        paths = sorted(p for p in self.directory.iterdir() if p.is_file() and fnmatch.fnmatch(p.name, self.pattern))
+        self.seen.update(p.name for p in paths)
+        return paths
+
+    def poll(self, timeout: float) -> list[Path]:
+        """Wait up to *timeout* seconds and return newly completed files."""
+
+        if self.inotify is not None:
+            names = self.inotify.read(timeout)
+            if self.inotify.overflowed:
+                self.inotify.overflowed = False
+                self.rescan = True
+            if self.rescan:
+                names += self._settled()
+        else:
+            time.sleep(timeout)
+            names = self._settled()
+        paths = []
+        for name in sorted(set(names)):
+            if name not in self.seen and fnmatch.fnmatch(name, self.pattern):
+                self.seen.add(name)
+                paths.append(self.directory / name)
+        return paths
+
+    def _settled(self) -> list[str]:
+        """Return unseen files untouched for ``settle`` seconds; keep ``rescan`` while others wait."""
+
+        cutoff = time.time() - self.settle
+        names, self.rescan = [], False
+        for entry in os.scandir(self.directory):
+            if entry.name in self.seen or not entry.is_file() or not fnmatch.fnmatch(entry.name, self.pattern):
+                continue
+            if entry.stat().st_mtime <= cutoff:
+                names.append(entry.name)
+            else:
+                self.rescan = True
+        return names
+
+    def close(self) -> None:
+        if self.inotify is not None:
+            self.inotify.close()
+
+
+class Ingestor:
+    """Decode files arriving in a directory into an NDJSON output."""
+
+    def __init__(self, directory: str | Path, output: str | Path, checkpoint: str | Path,
+                 models: str | None = None, jobs: int = 1, pattern: str = "*",
+                 poll_interval: float = 1.0, use_inotify: bool = True):
+        size = os.path.getsize(output) if os.path.exists(output) else 0
+        self.checkpoint = Checkpoint(checkpoint, start=size)
+        if size < self.checkpoint.offset:
+            self.checkpoint.close()
+            raise CheckpointError(
+                f"{output} is {size} bytes but {checkpoint} expects at least {self.checkpoint.offset}; "
+                "the output was truncated or replaced, move the checkpoint aside to start over"
+            )
+        self.output = open(output, "ab")
+        # Drop records written after the last checkpoint; their files are re-queued.
+        self.output.truncate(self.checkpoint.offset)
+        self.watcher = DirectoryWatcher(directory, pattern, poll_interval, use_inotify=use_inotify)
+        self.models = models
+        self.jobs = jobs
+        self.in_flight: dict[Future, Path] = {}
+
+    def _executor(self) -> Executor:
+        if self.jobs > 1:
+            return ProcessPoolExecutor(max_workers=self.jobs, initializer=init_worker, initargs=(self.models,))
+        init_worker(self.models)
+        return ThreadPoolExecutor(max_workers=1)
+
+    def _submit(self, executor: Executor, paths: list[Path]) -> None:
+        for path in paths:
+            if str(path) not in self.checkpoint.done:
+                self.in_flight[executor.submit(decode_file, path)] = path
+
+    def _drain(self) -> int:
+        finished = [future for future in self.in_flight if future.done()]
+        for future in finished:
+            self.in_flight.pop(future)
+            record = future.result()
+            self.output.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            self.output.flush()
+            os.fsync(self.output.fileno())
+            self.checkpoint.commit(record["source"], self.output.tell())
+        return len(finished)
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """Process existing and incoming files until *stop* is set."""
+
+        stop = stop or threading.Event()
+        with self._executor() as executor:
+            self._submit(executor, self.watcher.existing())
+            while not stop.is_set():
+                timeout = 0.005 if self.in_flight else self.watcher.poll_interval
+                self._submit(executor, self.watcher.poll(timeout))
+                self._drain()
+            while self.in_flight:
+                time.sleep(0.005)
+                self._drain()
+
+    def close(self) -> None:
+        self.watcher.close()
+        self.checkpoint.close()
+        self.output.close()
@@ -0,0 +1,112 @@
+"""Process-wide flyweight pool shared by every :class:`~pygwt.parser.GwtParser`.
+
+Once :func:`enable_interning` is called, parsers replace short table strings
+and the immutable builtin wrappers (:class:`~pygwt.models.BaseBuiltIn`
+subclasses such as ``Long`` or ``Bool``) with a single shared instance per
+value. Repeated values like ``"Vigente"`` or ``"CLP"`` then cost one object
+however many responses they appear in. The pool is a bounded LRU, so rare
+values age out instead of accumulating.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from pydantic import BaseModel
+
+_MISSING = object()
+
+
+class InternPool:
+    """Bounded LRU mapping from a value key to its canonical instance."""
+
+    def __init__(self, maxsize: int = 65_536, max_string_length: int = 64):
+        self.maxsize = maxsize
+        self.max_string_length = max_string_length
+        self.entries: OrderedDict[Any, Any] = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _lookup(self, key: Any) -> Any:
+        value = self.entries.get(key, _MISSING)
+        if value is not _MISSING:
+            self.entries.move_to_end(key)
+            self.hits += 1
+        return value
+
+    def _store(self, key: Any, value: Any) -> Any:
+        self.misses += 1
+        self.entries[key] = value
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return value
+
+    def intern_strings(self, values: list) -> list:
+        """Return *values* with short strings replaced by their pooled instance."""
+
+        limit = self.max_string_length
+        with self.lock:
+            result = []
+            for value in values:
+                if type(value) is str and len(value) <= limit:
+                    pooled = self._lookup(value)
+                    value = self._store(value, value) if pooled is _MISSING else pooled
+                result.append(value)
+            return result
+
+    def intern_model(self, model: type[BaseModel], payload: dict[str, Any]) -> BaseModel:
+        """Return the pooled ``model(**payload)``, building it only on a miss.
+
+        Wrappers holding a string longer than ``max_string_length`` (such as
+        whole ``Xml`` documents) are built but never pooled.
+        """
+
+        limit = self.max_string_length
+        values = payload.values()
+        if any(type(value) is str and len(value) > limit for value in values):
+            return model(**payload)
+        key = (model, *values)
+        try:
+            with self.lock:
+                cached = self._lookup(key)
+        except TypeError:  # unhashable field value
+            return model(**payload)
+        if cached is not _MISSING:
+            return cached
+        instance = model(**payload)
+        with self.lock:
+            cached = self._lookup(key)
+            return self._store(key, instance) if cached is _MISSING else cached
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.hits = self.misses = 0
+
+
+_pool: InternPool | None = None
+
+
+def enable_interning(maxsize: int = 65_536, max_string_length: int = 64) -> InternPool:
+    """Install (or replace) the process-wide pool and return it."""
+
+    global _pool
+    _pool = InternPool(maxsize, max_string_length)
+    return _pool
+
+
+def disable_interning() -> None:
+    global _pool
+    _pool = None
+
+
+def get_pool() -> InternPool | None:
+    """Return the active pool, or ``None`` when interning is disabled."""
+
+    return _pool
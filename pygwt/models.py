@@ -1,14 +1,21 @@
 from abc import ABCMeta
 from abc import abstractmethod
 from datetime import date, datetime
-from typing import Any
+from functools import cached_property
+from typing import Any, ClassVar, Iterable, Iterator
+from xml.etree.ElementTree import Element, XMLPullParser
 
-from pydantic import BaseModel, computed_field, model_serializer
+from pydantic import BaseModel, ConfigDict, computed_field, model_serializer
 from pygwt.utils import decoder
 
 
 class BaseBuiltIn(BaseModel, metaclass=ABCMeta):
-    """Base class for custom wrappers around primitive GWT types."""
+    """Base class for custom wrappers around primitive GWT types.
+
+    Instances are frozen so that :mod:`pygwt.intern` can share them.
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     @model_serializer
     def serializer(self):
@@ -71,7 +78,62 @@ class Xml(BaseBuiltIn):
     raw: str
 
     @computed_field
+    @cached_property
     def value(self) -> str:
         xml = self.raw.encode().decode('unicode-escape')
         return xml
 
+
+class XmlForm(Xml):
+    """``<FormularioRfi>`` document whose ``Codigos`` entries can be streamed.
+
+    Escape sequences are decoded once, on first access, and only when present;
+    ``gwt_splitter`` already unescapes most responses.
+    """
+
+    chunk_size: ClassVar[int] = 64 * 1024
+
+    @computed_field
+    @cached_property
+    def value(self) -> str:
+        if "\\" not in self.raw:
+            return self.raw
+        return self.raw.encode('latin1', 'backslashreplace').decode('unicode-escape')
+
+    def iter_fields(self, codes: Iterable[str] | None = None) -> Iterator[tuple[str, str | None]]:
+        """Yield ``(codigo, valor)`` pairs without building the whole tree.
+
+        When *codes* is given only those codes are yielded and parsing stops
+        as soon as all of them have been found.
+        """
+
+        wanted = set(codes) if codes is not None else None
+        parser = XMLPullParser(events=("start", "end"))
+        path: list[Element] = []  # open elements, root first
+        xml = self.value
+        for start in range(0, len(xml), self.chunk_size):
+            parser.feed(xml[start:start + self.chunk_size])
+            for event, element in parser.read_events():
+                if event == "start":
+                    path.append(element)
+                    continue
+                path.pop()
+                if element.tag == "Codigos":
+                    code = element.findtext("Codigo")
+                    if wanted is None or code in wanted:
+                        yield code, element.findtext("Valor")
+                        if wanted is not None:
+                            wanted.discard(code)
+                            if not wanted:
+                                return
+                elif len(path) != 1:
+                    continue
+                # Detach finished Codigos and top-level sections so memory stays flat.
+                if path:
+                    path[-1].remove(element)
+        parser.close()
+
+    def fields(self, codes: Iterable[str] | None = None) -> dict[str, str | None]:
+        """Return the form's ``Codigos`` as a ``{codigo: valor}`` mapping."""
+
+        return dict(self.iter_fields(codes))
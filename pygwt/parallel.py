@@ -0,0 +1,172 @@
+"""Decode the elements of one large top-level list on several processes.
+
+A skim pass runs the normal frame machine without building any model
+instances. It records where each top-level element starts in ``codes``, how
+many history slots exist at that point and the lowest slot each element
+back-references. Elements that reference objects decoded by earlier elements
+are grouped with them, so every group can be decoded on its own. A worker
+receives only its slice of ``codes``, the table and the history offset.
+Results are concatenated in order and match :meth:`GwtParser.parse`.
+
+When the root is not a list, or an element references the list itself,
+decoding falls back to a single :meth:`GwtParser.parse`.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from pygwt.parser import Frame, GwtParser
+from pygwt.utils import STATUS_EX
+
+
+@dataclass
+class Segment:
+    """A run of top-level elements that can be decoded independently."""
+
+    start: int  # index into ``codes`` just past the segment's first code
+    stop: int  # index into ``codes`` of the segment's last code
+    history_offset: int
+    count: int
+
+
+class _SkimParser(GwtParser):
+    """Walks the codes like :class:`GwtParser` without building values."""
+
+    def _setup(self, *args) -> None:
+        super()._setup(*args)
+        self.starts: list[tuple[int, int]] = []
+        self.min_refs: list[int | None] = []
+        self.end: int | None = None
+
+    def get_code_value(self, code: Any) -> Any:
+        if type(code) is int and code < 0 and self.min_refs:
+            slot = -code - 1
+            current = self.min_refs[-1]
+            if current is None or slot < current:
+                self.min_refs[-1] = slot
+        return super().get_code_value(code)
+
+    def _build_value(self, model: Any, value: Any) -> Any:
+        return value
+
+    def _build_object(self, frame: Frame) -> Any:
+        return None
+
+    def _handle_list(self, frame: Frame, stack: deque[Frame], root: list) -> None:
+        if frame.parent is None:
+            if frame.index < frame.length:
+                self.starts.append((len(self.codes), self.object_count))
+                self.min_refs.append(None)
+            else:
+                self.end = len(self.codes)
+        super()._handle_list(frame, stack, root)
+
+
+def plan_segments(status: str, codes: list, table: list, gwt_models=None) -> list[Segment] | None:
+    """Split the top-level list of a response into independent segments.
+
+    Returns ``None`` when the response cannot be split.
+    """
+
+    skim = _SkimParser.from_parts(status, list(codes), table, gwt_models)
+    skim.parse()
+    if not skim.starts or skim.end is None:
+        return None
+    first_slot = skim.starts[0][1]
+
+    groups: list[int] = []  # index of the first element of each group
+    for index, min_ref in enumerate(skim.min_refs):
+        if min_ref is None or min_ref >= skim.starts[index][1]:
+            groups.append(index)
+            continue
+        if min_ref < first_slot:
+            return None  # refers to the list itself
+        while skim.starts[groups[-1]][1] > min_ref:
+            groups.pop()
+
+    bounds = [skim.starts[index][0] for index in groups] + [skim.end]
+    elements = groups + [len(skim.starts)]
+    return [
+        Segment(
+            start=bounds[i],
+            stop=bounds[i + 1],
+            history_offset=skim.starts[elements[i]][1],
+            count=elements[i + 1] - elements[i],
+        )
+        for i in range(len(groups))
+    ]
+
+
+def _batch(segments: list[Segment], batches: int) -> list[Segment]:
+    """Merge adjacent segments into about *batches* runs of similar code size."""
+
+    total = segments[0].start - segments[-1].stop
+    target = max(1, total // batches)
+    merged: list[Segment] = []
+    for segment in segments:
+        last = merged[-1] if merged else None
+        if last is not None and last.start - last.stop < target:
+            last.stop = segment.stop
+            last.count += segment.count
+        else:
+            merged.append(Segment(segment.start, segment.stop, segment.history_offset, segment.count))
+    return merged
+
+
+def _decode_segment(codes: list, table: list, gwt_models, history_offset: int, count: int) -> list:
+    parser = GwtParser.from_parts("//OK", codes, table, gwt_models)
+    parser.history = [None] * history_offset
+    parser.object_count = history_offset
+    results = []
+    for _ in range(count):
+        model = parser.parse_model_type(parser.get_code_value(parser.codes[-1]))
+        results.append(parser.parse(model))
+    return results
+
+
+def parse_parallel(
+    response: str,
+    gwt_models: dict[str, Any] | None = None,
+    executor: Executor | None = None,
+    jobs: int | None = None,
+    min_codes: int = 50_000,
+) -> Any:
+    """Decode *response* like ``GwtParser(response, gwt_models).parse()``, in parallel.
+
+    Responses with fewer than ``min_codes`` codes are decoded directly since
+    the skim pass and result transfer would outweigh the gain. A
+    ``ProcessPoolExecutor`` with ``jobs`` workers is created when no
+    ``executor`` is given.
+    """
+
+    parser = GwtParser(response, gwt_models)
+    if parser.status == STATUS_EX or not parser.table or len(parser.codes) < min_codes:
+        return parser.parse()
+    segments = plan_segments(parser.status, parser.codes, parser.table, gwt_models)
+    if segments is None or len(segments) < 2:
+        return parser.parse()
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=jobs)
+    try:
+        workers = getattr(executor, "_max_workers", None) or jobs or 1
+        codes, table = parser.codes, parser.table
+        futures = [
+            executor.submit(
+                _decode_segment, codes[segment.stop:segment.start], table, gwt_models,
+                segment.history_offset, segment.count,
+            )
+            for segment in _batch(segments, workers * 4)
+        ]
+        results = []
+        for future in futures:
+            results.extend(future.result())
+        return results
+    finally:
+        if own_executor:
+            executor.shutdown()
@@ -1,15 +1,27 @@
 from __future__ import annotations
 
+import asyncio
 import re
+import time
 from collections import deque
-from dataclasses import dataclass, field
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from functools import cache
 from enum import Enum, auto
 from typing import Any
 
 from pydantic import BaseModel
 
 from pygwt import models
-from pygwt.utils import gwt_splitter, get_pydantic_fields, separate_annotation
+from pygwt.exceptions import GwtRemoteException
+from pygwt.intern import get_pool
+from pygwt.utils import (
+    STATUS_EX,
+    get_pydantic_fields,
+    gwt_splitter,
+    import_object,
+    separate_annotation,
+)
 
 # -------------------------------------------------------------------------- #
 #                          GWT-RPC RESPONSE DECODER                          #
@@ -96,15 +108,46 @@ Example using the instruction sequence::
 """
 
 
+@dataclass(frozen=True)
+class CodeScan:
+    """Summary of a single pass over the raw ``codes`` of a response."""
+
+    references: frozenset[int]
+    code_count: int
+
+    @property
+    def max_reference(self) -> int:
+        """Highest history slot targeted by a back-reference, or ``-1``."""
+        return max(self.references, default=-1)
+
+
+def scan_codes(codes: list) -> CodeScan:
+    """Collect the history slots targeted by negative codes.
+
+    Negative integers are treated as back-references even when they are
+    plain ``Integer`` values, so the result is a safe superset of the slots
+    the parser will actually look up. For the same reason the scan cannot
+    tell a truncated response from a valid one holding large negative
+    integers; truncation surfaces in :func:`gwt_splitter` or while parsing.
+    """
+
+    references = frozenset(-code - 1 for code in codes if type(code) is int and code < 0)
+    return CodeScan(references=references, code_count=len(codes))
+
+
 class Stage(Enum):
     START = auto()
     LIST = auto()
     OBJ = auto()
 
 
-@dataclass
+@dataclass(slots=True)
 class Frame:
-    """Represents the state of a partial parse operation."""
+    """Represents the state of a partial parse operation.
+
+    Containers are only created by the stage that fills them: ``results`` for
+    ``Stage.LIST``, ``fields``/``payload`` for ``Stage.OBJ``.
+    """
 
     stage: Stage
     model: Any | None = None
@@ -114,9 +157,15 @@ class Frame:
     length: int | None = None
     index: int = 0
     model_class: type | None = None
-    fields: list[tuple[str, Any]] = field(default_factory=list)
-    payload: dict[str, Any] = field(default_factory=dict)
-    results: list[Any] = field(default_factory=list)
+    fields: tuple[tuple[str, Any], ...] | None = None
+    payload: dict[str, Any] | None = None
+    results: list[Any] | None = None
+
+
+@cache
+def _model_fields(model: type[BaseModel]) -> tuple[tuple[str, Any], ...]:
+    """Return the resolved ``(name, annotation)`` pairs of *model*, computed once per class."""
+    return tuple(get_pydantic_fields(model).items())
 
 
 class GwtParser:
@@ -132,11 +181,29 @@ class GwtParser:
         "Timestamp": models.TimeStamp,
     }
 
-    def __init__(self, response, gwt_models=None):
+    def __init__(self, response, gwt_models=None, prescan=False):
         status, codes, table = gwt_splitter(response)
+        self._setup(status, codes, table, gwt_models, prescan)
+
+    @classmethod
+    def from_parts(cls, status: str, codes: list, table: list, gwt_models=None, prescan=False) -> "GwtParser":
+        """Build a parser from an already split response (see :func:`gwt_splitter`)."""
+        parser = cls.__new__(cls)
+        parser._setup(status, codes, table, gwt_models, prescan)
+        return parser
+
+    def _setup(self, status, codes, table, gwt_models, prescan) -> None:
+        self.interner = get_pool()
+        self.status = status
         self.codes = codes
-        self.table = table
-        self.history = []
+        self.table = table if self.interner is None else self.interner.intern_strings(table)
+        self.object_count = 0
+        self.max_depth = 0
+        # With ``prescan`` only slots targeted by a back-reference are kept, so
+        # ``history`` becomes a sparse ``{slot: value}`` mapping.
+        self.scan = scan_codes(codes) if prescan else None
+        self.history = {} if prescan else []
+        self._frame_pool: list[Frame] = []
         if gwt_models is not None:
             self.gwt_models.update(gwt_models)
 
@@ -166,10 +233,39 @@ class GwtParser:
         else:
             model_name = value
         model = self.gwt_models.get(model_name, Any)
+        if isinstance(model, str):  # lazy "module:Class" entry, imported on first use
+            model = self.gwt_models[model_name] = import_object(model)
         if matches and model is Any:
             raise KeyError(f"Missing model {model_name}")
         return model
 
+    def _reserve_slot(self, model: Any) -> int | None:
+        """Reserve the next history slot, returning ``None`` if it is never referenced."""
+
+        slot = self.object_count
+        self.object_count += 1
+        if self.scan is None:
+            self.history.append(f"placeholder_{model}")
+            return slot
+        if slot in self.scan.references:
+            self.history[slot] = None
+            return slot
+        return None
+
+    def _new_frame(self, model: Any, parent: Frame, key: str | None = None) -> Frame:
+        """Return a ``Stage.START`` frame, recycled from the pool when possible."""
+
+        if not self._frame_pool:
+            return Frame(Stage.START, model, parent, key)
+        frame = self._frame_pool.pop()
+        frame.stage = Stage.START
+        frame.model = model
+        frame.parent = parent
+        frame.key = key
+        frame.placeholder = None
+        frame.index = 0
+        return frame
+
     def _finalize(self, frame: Frame, result: Any, stack: deque[Frame], root: list) -> None:
         """Store ``result`` and update ``stack`` for the completed ``frame``."""
 
@@ -183,6 +279,20 @@ class GwtParser:
             parent.results.append(result)
         else:
             parent.payload[frame.key] = result
+        # ``results``/``payload`` now belong to the caller; only drop references
+        # the next user of this frame would not overwrite.
+        frame.parent = frame.results = frame.payload = frame.fields = None
+        self._frame_pool.append(frame)
+
+    def _build_value(self, model: Any, value: Any) -> Any:
+        """Wrap a primitive *value* in its *model* type."""
+        return model(value) if model is not Any and value is not None else value
+
+    def _build_object(self, frame: Frame) -> Any:
+        """Instantiate the model of a completed ``Stage.OBJ`` frame."""
+        if self.interner is not None and issubclass(frame.model_class, models.BaseBuiltIn):
+            return self.interner.intern_model(frame.model_class, frame.payload)
+        return frame.model_class(**frame.payload)
 
     # ------------------------------------------------------------------
     # Stage handlers
@@ -217,8 +327,7 @@ class GwtParser:
                     value = self.get_code_value(value)
 
         if parsed_model is not Any:
-            frame.placeholder = len(self.history)
-            self.history.append(f"placeholder_{model}")
+            frame.placeholder = self._reserve_slot(model)
 
         if value is None:
             self._finalize(frame, None, stack, root)
@@ -233,15 +342,13 @@ class GwtParser:
         elif isinstance(model, type) and issubclass(model, BaseModel):
             if parsed_model is Any:
                 self.codes.append(code)
-            fields = get_pydantic_fields(model)
             frame.stage = Stage.OBJ
-            frame.fields = list(fields.items())
+            frame.fields = _model_fields(model)
             frame.payload = {}
             frame.index = 0
             frame.model_class = model
         else:
-            result = model(value) if model is not Any and value is not None else value
-            self._finalize(frame, result, stack, root)
+            self._finalize(frame, self._build_value(model, value), stack, root)
 
     def _handle_list(self, frame: Frame, stack: deque[Frame], root: list) -> None:
         """Process a ``Stage.LIST`` frame."""
@@ -254,30 +361,91 @@ class GwtParser:
         value = self.get_code_value(code)
         model = self.parse_model_type(value)
         frame.index += 1
-        stack.append(Frame(stage=Stage.START, model=model, parent=frame))
+        stack.append(self._new_frame(model, frame))
+        if len(stack) > self.max_depth:
+            self.max_depth = len(stack)
 
     def _handle_obj(self, frame: Frame, stack: deque[Frame], root: list) -> None:
         """Process a ``Stage.OBJ`` frame."""
 
         if frame.index >= len(frame.fields):
-            obj = frame.model_class(**frame.payload)
-            self._finalize(frame, obj, stack, root)
+            self._finalize(frame, self._build_object(frame), stack, root)
             return
 
         field, annotation = frame.fields[frame.index]
         frame.index += 1
-        stack.append(
-            Frame(stage=Stage.START, model=annotation, parent=frame, key=field)
-        )
+        stack.append(self._new_frame(annotation, frame, field))
+        if len(stack) > self.max_depth:
+            self.max_depth = len(stack)
+
+    def parse_exception(self) -> GwtRemoteException:
+        """Decode a thrown Java exception, following its chain of causes."""
+
+        value = self.get_code_value(self.codes.pop())
+        java_class = value.split("/")[0] if isinstance(value, str) else str(value)
+        message = self.get_code_value(self.codes.pop()) if self.codes else None
+        cause = None
+        if self.codes:
+            code = self.codes[-1]
+            nested = self.get_code_value(code) if isinstance(code, int) and code > 0 else None
+            if code == 0:
+                self.codes.pop()
+            elif isinstance(nested, str) and re.search(r"(Exception|Error|Throwable)/\d+$", nested):
+                cause = self.parse_exception()
+        return GwtRemoteException(java_class, message, cause)
 
     def parse(self, model: Any | None = None) -> Any:
-        """Decode the next value from ``self.codes`` using an optional annotation."""
+        """Decode the next value from ``self.codes`` using an optional annotation.
+
+        Raises:
+            GwtRemoteException: If the response has an ``//EX`` status.
+        """
+        if not self.table:
+            return None
+        if self.status == STATUS_EX:
+            raise self.parse_exception()
+
+        stack = deque([Frame(stage=Stage.START, model=model)])
+        root = [None]
+        self._run(stack, root)
+        return root[0]
+
+    async def parse_async(
+        self,
+        model: Any | None = None,
+        budget_ms: float = 5.0,
+        executor: Executor | None = None,
+        offload_threshold: int | None = None,
+    ) -> Any:
+        """Decode like :meth:`parse`, yielding to the event loop between slices.
+
+        Each slice runs the frame loop for at most ``budget_ms``. Responses with
+        at least ``offload_threshold`` codes are parsed in ``executor`` (the
+        loop's default executor when ``None``) instead.
+
+        Raises:
+            GwtRemoteException: If the response has an ``//EX`` status.
+        """
+        if offload_threshold is not None and len(self.codes) >= offload_threshold:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(executor, self.parse, model)
         if not self.table:
             return None
+        if self.status == STATUS_EX:
+            raise self.parse_exception()
 
         stack = deque([Frame(stage=Stage.START, model=model)])
         root = [None]
+        budget = budget_ms / 1000
+        while not self._run(stack, root, budget):
+            await asyncio.sleep(0)
+        return root[0]
 
+    def _run(self, stack: deque[Frame], root: list, budget: float | None = None) -> bool:
+        """Advance the frame loop, returning ``False`` if ``budget`` seconds ran out."""
+
+        deadline = None if budget is None else time.perf_counter() + budget
+        steps = 0
         while stack:
             frame = stack[-1]
             if frame.stage is Stage.START:
@@ -286,5 +454,9 @@ class GwtParser:
                 self._handle_list(frame, stack, root)
             else:
                 self._handle_obj(frame, stack, root)
-
-        return root[0]
+            if deadline is not None:
+                steps += 1
+                # Reading the clock on every frame would dominate small frames.
+                if not steps & 0x7F and time.perf_counter() >= deadline:
+                    return False
+        return True
@@ -0,0 +1,221 @@
+"""Local replay server and load generator for GWT integrations.
+
+:class:`ReplayServer` stands in for the SII service. It serves the
+``.nocache.js``/``.cache.html`` bootstrap files :class:`~pygwt.gwt_codes.GwtCodes`
+scrapes, and answers every RPC ``POST`` with a captured response from a corpus
+directory or a synthetic ``Vector`` of integers. Latency, error rate and the
+synthetic size distribution are configurable and seeded, so runs are
+reproducible.
+
+:func:`run_load` drives ``GwtCodes`` and ``GwtParser`` end-to-end against a
+server at a fixed concurrency and reports latency percentiles and throughput.
+"""
+
+from __future__ import annotations
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import requests
+
+from pygwt.gwt_codes import HEADERS, Endpoint, Rfi, SifmConsulta
+from pygwt.parser import GwtParser
+
+PERMUTATION = "0123456789ABCDEF0123456789ABCDEF"
+STRONG_NAME = "FEDCBA9876543210FEDCBA9876543210"
+ERROR_RESPONSE = (
+    '//EX[2,1,["com.google.gwt.user.client.rpc.SerializationException/2836333220",'
+    '"replay server injected error"],0,7]'
+)
+
+
+def bootstrap_files(endpoint: str) -> dict[str, str]:
+    """Return the bootstrap files ``GwtCodes`` fetches for *endpoint*, by path."""
+
+    nocache = f"var a='gecko',b='safari';c=[b],p;p='{PERMUTATION}';"
+    if endpoint == Endpoint.rfi.value:
+        cache = f"x('formularioFacade','{STRONG_NAME}');"
+    else:
+        cache = f"s='svcConsulta';x(s,'{STRONG_NAME}');"
+    prefix = f"/{endpoint}Internet"
+    return {
+        f"{prefix}/{endpoint}.nocache.js": nocache,
+        f"{prefix}/{PERMUTATION}.cache.html": cache,
+    }
+
+
+def synthetic_response(size: int, rng: random.Random | None = None) -> str:
+    """Build an ``//OK`` response holding a ``Vector`` of *size* integers."""
+
+    rng = rng or random.Random()
+    codes = [1, size]
+    for _ in range(size):
+        codes += [2, rng.randrange(1 << 31)]
+    table = '"java.util.Vector/3057315478","java.lang.Integer/3438268394"'
+    return f"//OK[{','.join(map(str, reversed(codes)))},[{table}],0,7]"
+
+
+@dataclass
+class ReplayConfig:
+    corpus: list[str]
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    # Synthetic responses are used for this share of calls, sized uniformly
+    # from ``synthetic_sizes``.
+    synthetic_ratio: float = 0.0
+    synthetic_sizes: tuple[int, ...] = (10, 100, 1000)
+    seed: int | None = None
+
+
+class ReplayServer(ThreadingHTTPServer):
+    """HTTP server replaying GWT responses; use as a context manager."""
+
+    daemon_threads = True
+
+    def __init__(self, corpus: str | Path | None = None, host: str = "127.0.0.1", port: int = 0, **options: Any):
+        responses = []
+        if corpus is not None:
+            responses = [p.read_text(encoding="utf-8") for p in sorted(Path(corpus).rglob("*.txt"))]
+        self.config = ReplayConfig(corpus=responses, **options)
+        if not responses:
+            self.config.synthetic_ratio = 1.0
+        self.rng = random.Random(self.config.seed)
+        self.rng_lock = threading.Lock()
+        self.files = {}
+        for endpoint in Endpoint:
+            self.files.update(bootstrap_files(endpoint.value))
+        super().__init__((host, port), _ReplayHandler)
+        self.thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_reply(self) -> tuple[float, int, str]:
+        """Pick ``(delay_seconds, status_code, body)`` for the next RPC call."""
+
+        config = self.config
+        with self.rng_lock:
+            delay = max(0.0, config.latency_ms + self.rng.uniform(-config.jitter_ms, config.jitter_ms)) / 1000
+            if self.rng.random() < config.error_rate:
+                return delay, 200, ERROR_RESPONSE
+            if self.rng.random() < config.synthetic_ratio:
+                return delay, 200, synthetic_response(self.rng.choice(config.synthetic_sizes), self.rng)
+            return delay, 200, self.rng.choice(config.corpus)
+
+    def start(self) -> "ReplayServer":
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __enter__(self) -> "ReplayServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.shutdown()
+        self.server_close()
+
+
+class _ReplayHandler(BaseHTTPRequestHandler):
+    server: ReplayServer
+    protocol_version = "HTTP/1.1"
+
+    def _send(self, status: int, body: str, content_type: str) -> None:
+        data = body.encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        body = self.server.files.get(self.path)
+        if body is None:
+            self._send(404, "not found", "text/plain")
+        else:
+            self._send(200, body, "text/html")
+
+    def do_POST(self) -> None:
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        delay, status, body = self.server.next_reply()
+        time.sleep(delay)
+        self._send(status, body, "text/plain; charset=utf-8")
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+
+@dataclass
+class LoadReport:
+    requests: int
+    errors: int
+    elapsed: float
+    latencies: list[float]
+
+    def percentile(self, q: float) -> float:
+        """Latency in seconds at quantile *q* (``0 <= q <= 1``)."""
+
+        if not self.latencies:
+            return 0.0
+        ordered = sorted(self.latencies)
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.requests} requests ({self.errors} errors) in {self.elapsed:.2f}s: "
+            f"{self.throughput:.1f} req/s, p50 {self.percentile(0.5) * 1000:.1f} ms, "
+            f"p99 {self.percentile(0.99) * 1000:.1f} ms"
+        )
+
+
+def run_load(
+    base_url: str,
+    endpoint: Endpoint = Endpoint.sifm_consulta,
+    requests_total: int = 100,
+    concurrency: int = 8,
+    gwt_models: dict[str, Any] | None = None,
+) -> LoadReport:
+    """Issue RPC calls at *concurrency* and decode every response."""
+
+    codes = (Rfi if endpoint == Endpoint.rfi else SifmConsulta)(base_url=base_url)
+    url = f"{base_url}/{codes.endpoint}Internet/{codes.endpoint}/"
+    local = threading.local()
+
+    def call(_index: int) -> tuple[float, bool]:
+        session = getattr(local, "session", None)
+        if session is None:
+            session = local.session = requests.Session()
+        headers = {**HEADERS, "Content-Type": "text/x-gwt-rpc; charset=utf-8",
+                   "X-GWT-Permutation": codes.gwt_permutation}
+        body = f"7|0|4|{url}|{codes.strong_name}|service|method|1|2|3|4|0|"
+        start = time.perf_counter()
+        try:
+            response = session.post(url, data=body.encode("utf-8"), headers=headers)
+            GwtParser(response.text, gwt_models).parse()
+            failed = response.status_code != 200
+        except Exception:  # transport, //EX and decode failures all count as errors
+            failed = True
+        return time.perf_counter() - start, failed
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(call, range(requests_total)))
+    elapsed = time.perf_counter() - start
+    return LoadReport(
+        requests=requests_total,
+        errors=sum(failed for _, failed in results),
+        elapsed=elapsed,
+        latencies=[latency for latency, _ in results],
+    )
@@ -0,0 +1,209 @@
+"""Rate-limited request scheduling for the SII GWT endpoints.
+
+:class:`RequestScheduler` runs a caller-supplied ``send(endpoint, payload)``
+function on a pool of worker threads. Calls are ordered by :class:`Priority`,
+paced by a :class:`TokenBucket` per endpoint and capped by an
+:class:`AdaptiveConcurrency` limit that halves on throttling (HTTP 429/503 or
+an ``//EX`` body) and grows back one slot per window of successful calls.
+
+``send`` must return an object with ``status_code`` and ``text`` attributes,
+such as a ``requests.Response``.
+"""
+
+from __future__ import annotations
+
+import itertools
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from enum import Enum, IntEnum
+from typing import Any, Callable, Mapping
+
+from pygwt.utils import STATUS_EX
+
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+STALE_CODES_MARKER = "IncompatibleRemoteServiceException"
+
+
+class Priority(IntEnum):
+    INTERACTIVE = 0
+    BATCH = 1
+
+
+def _endpoint_key(endpoint: Any) -> str:
+    return endpoint.value if isinstance(endpoint, Enum) else str(endpoint)
+
+
+class TokenBucket:
+    """Allow ``rate`` calls per second with bursts of up to ``capacity``."""
+
+    def __init__(self, rate: float, capacity: float | None = None, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self.tokens = self.capacity
+        self.clock = clock
+        self.updated_at = clock()
+        self.lock = threading.Lock()
+
+    def try_acquire(self) -> float:
+        """Take a token if available; otherwise return the seconds to wait."""
+
+        with self.lock:
+            now = self.clock()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return 0.0
+            return (1 - self.tokens) / self.rate
+
+    def acquire(self) -> None:
+        while (wait := self.try_acquire()) > 0:
+            time.sleep(wait)
+
+
+class AdaptiveConcurrency:
+    """Concurrency limit with additive increase and multiplicative decrease."""
+
+    def __init__(self, initial: int = 4, minimum: int = 1, maximum: int = 32, backoff: float = 0.5):
+        self.limit = float(initial)
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.in_flight = 0
+        self.condition = threading.Condition()
+
+    def acquire(self) -> None:
+        with self.condition:
+            while self.in_flight >= int(self.limit):
+                self.condition.wait()
+            self.in_flight += 1
+
+    def release(self, throttled: bool = False) -> None:
+        with self.condition:
+            self.in_flight -= 1
+            if throttled:
+                self.limit = max(self.minimum, self.limit * self.backoff)
+            else:
+                self.limit = min(self.maximum, self.limit + 1 / self.limit)
+            self.condition.notify_all()
+
+
+def is_throttled(response: Any) -> bool:
+    """Return whether *response* signals that the service is shedding load."""
+
+    if response.status_code in THROTTLE_STATUS_CODES:
+        return True
+    return response.text.startswith(STATUS_EX) and STALE_CODES_MARKER not in response.text
+
+
+class RequestScheduler:
+    """Run ``send`` calls with per-endpoint pacing and adaptive concurrency.
+
+    ``codes`` maps endpoints to their :class:`~pygwt.gwt_codes.GwtCodes`;
+    when a response reports stale permutation/strong-name tokens, the
+    matching instance is refreshed before the call is retried.
+    """
+
+    def __init__(
+        self,
+        send: Callable[[str, Any], Any],
+        rates: Mapping[Any, float] | None = None,
+        default_rate: float = 5.0,
+        workers: int = 8,
+        concurrency: AdaptiveConcurrency | None = None,
+        codes: Mapping[Any, Any] | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+    ):
+        self.send = send
+        self.default_rate = default_rate
+        self.buckets = {_endpoint_key(key): TokenBucket(rate) for key, rate in (rates or {}).items()}
+        self.concurrency = concurrency or AdaptiveConcurrency(maximum=workers)
+        self.codes = {_endpoint_key(key): value for key, value in (codes or {}).items()}
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.queue: queue.PriorityQueue = queue.PriorityQueue()
+        self.counter = itertools.count()
+        self.lock = threading.Lock()
+        self.refresh_locks: dict[str, threading.Lock] = {}
+        self.threads = [threading.Thread(target=self._work, daemon=True) for _ in range(workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def __enter__(self) -> "RequestScheduler":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        with self.lock:
+            bucket = self.buckets.get(endpoint)
+            if bucket is None:
+                bucket = self.buckets[endpoint] = TokenBucket(self.default_rate)
+            return bucket
+
+    def submit(self, endpoint: Any, payload: Any, priority: Priority = Priority.BATCH) -> Future:
+        """Queue a call and return a future for its response."""
+
+        future: Future = Future()
+        self.queue.put((priority, next(self.counter), (_endpoint_key(endpoint), payload, future, 0)))
+        return future
+
+    def close(self) -> None:
+        """Finish queued calls and stop the workers."""
+
+        for _ in self.threads:
+            # Sorts after every real priority, so pending work is drained first.
+            self.queue.put((len(Priority), next(self.counter), None))
+        for thread in self.threads:
+            thread.join()
+
+    def _work(self) -> None:
+        while True:
+            priority, _, task = self.queue.get()
+            if task is None:
+                return
+            endpoint, payload, future, attempt = task
+            if attempt == 0 and not future.set_running_or_notify_cancel():
+                continue
+            self.concurrency.acquire()
+            self.bucket(endpoint).acquire()
+            sent_at = time.time()
+            try:
+                response = self.send(endpoint, payload)
+            except Exception as exc:
+                self.concurrency.release()
+                future.set_exception(exc)
+                continue
+            released = False
+            try:
+                throttled = is_throttled(response)
+                self.concurrency.release(throttled)
+                released = True
+                stale = STALE_CODES_MARKER in response.text and endpoint in self.codes
+                if (throttled or stale) and attempt < self.max_retries:
+                    if stale:
+                        self._refresh(endpoint, sent_at)
+                    else:
+                        time.sleep(self.retry_delay * 2 ** attempt)
+                    self.queue.put((priority, next(self.counter), (endpoint, payload, future, attempt + 1)))
+                else:
+                    future.set_result(response)
+            except Exception as exc:
+                if not released:
+                    self.concurrency.release()
+                if not future.done():
+                    future.set_exception(exc)
+
+    def _refresh(self, endpoint: str, sent_at: float) -> None:
+        """Refresh the endpoint's tokens unless another worker did after *sent_at*."""
+
+        with self.lock:
+            lock = self.refresh_locks.setdefault(endpoint, threading.Lock())
+        with lock:
+            codes = self.codes[endpoint]
+            if getattr(codes, "updated_at", 0) <= sent_at:
+                codes.update()
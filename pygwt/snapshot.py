@@ -0,0 +1,259 @@
+"""Compact binary snapshots of parsed object graphs.
+
+The layout mirrors the GWT wire model: a string table followed by a stream of
+tagged values that point into it. Lists, dicts and models are numbered in the
+order they are first written, so an object reached twice (as produced by
+``GwtParser`` back-references) is stored once and shared again on load::
+
+    b"PGWT" version
+    varint(len(strings)) [varint(len(utf8)) utf8]...
+    value
+
+Pydantic models are written as their ``module:qualname`` followed by their
+field values and rebuilt without validation; the original parse already
+validated them. Only :class:`~pydantic.BaseModel` subclasses are rebuilt, and
+:func:`loads` can be limited further to an explicit set of models. Still, only
+load snapshots you trust: without an allow-list the named modules are
+imported, and field values are never checked.
+
+Compared with ``pickle`` this is pure Python: loading is several times slower
+and output is only slightly smaller. Pickle keeps shared references as well.
+The format is worth using when a snapshot must not run arbitrary code on load,
+must be read in place from a buffer, or must outlive pickle's coupling to
+class internals. For plain IPC between trusted processes, pickle is faster.
+"""
+
+from __future__ import annotations
+
+import importlib
+import struct
+from datetime import date, datetime
+from typing import Any, Iterable
+
+from pydantic import BaseModel
+
+MAGIC = b"PGWT"
+VERSION = 1
+
+NONE, TRUE, FALSE, INT, FLOAT, STR, LIST, DICT, MODEL, REF, DATE, DATETIME = range(12)
+
+_DOUBLE = struct.Struct("<d")
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _read_varint(data: memoryview, pos: int) -> tuple[int, int]:
+    result = shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+class _Writer:
+    def __init__(self):
+        self.body = bytearray()
+        self.strings: dict[str, int] = {}
+        self.objects: dict[int, int] = {}
+        self.fields: dict[type, tuple[str, ...]] = {}
+
+    def string(self, value: str) -> int:
+        index = self.strings.get(value)
+        if index is None:
+            index = self.strings[value] = len(self.strings)
+        return index
+
+    def shared(self, value: Any) -> bool:
+        """Write a back-reference if *value* was already written, else number it."""
+
+        index = self.objects.get(id(value))
+        if index is not None:
+            self.body.append(REF)
+            _write_varint(self.body, index)
+            return True
+        self.objects[id(value)] = len(self.objects)
+        return False
+
+    def write(self, value: Any) -> None:
+        body = self.body
+        if value is None:
+            body.append(NONE)
+        elif value is True:
+            body.append(TRUE)
+        elif value is False:
+            body.append(FALSE)
+        elif isinstance(value, int):
+            body.append(INT)
+            _write_varint(body, value << 1 if value >= 0 else (~value << 1) | 1)
+        elif isinstance(value, float):
+            body.append(FLOAT)
+            body += _DOUBLE.pack(value)
+        elif isinstance(value, str):
+            body.append(STR)
+            _write_varint(body, self.string(value))
+        elif isinstance(value, (list, tuple)):
+            if self.shared(value):
+                return
+            body.append(LIST)
+            _write_varint(body, len(value))
+            for item in value:
+                self.write(item)
+        elif isinstance(value, dict):
+            if self.shared(value):
+                return
+            body.append(DICT)
+            _write_varint(body, len(value))
+            for key, item in value.items():
+                self.write(key)
+                self.write(item)
+        elif isinstance(value, BaseModel):
+            if self.shared(value):
+                return
+            cls = type(value)
+            names = self.fields.get(cls)
+            if names is None:
+                names = self.fields[cls] = tuple(cls.model_fields)
+            body.append(MODEL)
+            _write_varint(body, self.string(f"{cls.__module__}:{cls.__qualname__}"))
+            for name in names:
+                self.write(getattr(value, name))
+        elif isinstance(value, datetime):
+            body.append(DATETIME)
+            _write_varint(body, self.string(value.isoformat()))
+        elif isinstance(value, date):
+            body.append(DATE)
+            _write_varint(body, self.string(value.isoformat()))
+        else:
+            raise TypeError(f"cannot snapshot value of type {type(value).__name__}")
+
+
+def dumps(value: Any) -> bytes:
+    """Serialize a parse result into the snapshot format."""
+
+    writer = _Writer()
+    writer.write(value)
+    out = bytearray(MAGIC)
+    out.append(VERSION)
+    _write_varint(out, len(writer.strings))
+    for string in writer.strings:
+        encoded = string.encode("utf-8")
+        _write_varint(out, len(encoded))
+        out += encoded
+    out += writer.body
+    return bytes(out)
+
+
+class _Reader:
+    def __init__(self, data: memoryview, models: Iterable[type] | None = None):
+        self.data = data
+        self.allowed = None if models is None else {f"{cls.__module__}:{cls.__qualname__}": cls for cls in models}
+        self.objects: list[Any] = []
+        self.classes: dict[int, tuple[type, tuple[str, ...]]] = {}
+        if bytes(data[:4]) != MAGIC:
+            raise ValueError("not a pygwt snapshot")
+        if data[4] != VERSION:
+            raise ValueError(f"unsupported snapshot version {data[4]}")
+        count, pos = _read_varint(data, 5)
+        # Strings are decoded straight from the buffer, without slicing copies.
+        strings = []
+        for _ in range(count):
+            length, pos = _read_varint(data, pos)
+            strings.append(str(data[pos:pos + length], "utf-8"))
+            pos += length
+        self.strings = strings
+        self.pos = pos
+
+    def model_class(self, index: int) -> tuple[type, tuple[str, ...]]:
+        entry = self.classes.get(index)
+        if entry is None:
+            name = self.strings[index]
+            if self.allowed is not None:
+                cls = self.allowed.get(name)
+                if cls is None:
+                    raise ValueError(f"snapshot model {name!r} is not allowed")
+            else:
+                module_name, _, qualname = name.partition(":")
+                cls = importlib.import_module(module_name)
+                for part in qualname.split("."):
+                    cls = getattr(cls, part)
+            if not (isinstance(cls, type) and issubclass(cls, BaseModel)):
+                raise ValueError(f"snapshot model {name!r} is not a pydantic model")
+            entry = self.classes[index] = (cls, tuple(cls.model_fields))
+        return entry
+
+    def read(self) -> Any:
+        data = self.data
+        tag = data[self.pos]
+        self.pos += 1
+        if tag == NONE:
+            return None
+        if tag == TRUE:
+            return True
+        if tag == FALSE:
+            return False
+        if tag == FLOAT:
+            (value,) = _DOUBLE.unpack_from(data, self.pos)
+            self.pos += _DOUBLE.size
+            return value
+
+        number, self.pos = _read_varint(data, self.pos)
+        if tag == STR:
+            return self.strings[number]
+        if tag == INT:
+            return ~(number >> 1) if number & 1 else number >> 1
+        if tag == REF:
+            return self.objects[number]
+        if tag == LIST:
+            result = []
+            self.objects.append(result)
+            for _ in range(number):
+                result.append(self.read())
+            return result
+        if tag == DICT:
+            result = {}
+            self.objects.append(result)
+            for _ in range(number):
+                key = self.read()
+                result[key] = self.read()
+            return result
+        if tag == MODEL:
+            cls, names = self.model_class(number)
+            slot = len(self.objects)
+            self.objects.append(None)
+            result = cls.__new__(cls)
+            # Same state pickle restores; skips ``model_construct`` overhead.
+            result.__setstate__({
+                "__dict__": {name: self.read() for name in names},
+                "__pydantic_extra__": None,
+                "__pydantic_fields_set__": set(names),
+                "__pydantic_private__": None,
+            })
+            self.objects[slot] = result
+            return result
+        if tag == DATETIME:
+            return datetime.fromisoformat(self.strings[number])
+        if tag == DATE:
+            return date.fromisoformat(self.strings[number])
+        raise ValueError(f"corrupt snapshot: unknown tag {tag}")
+
+
+def loads(data: bytes | bytearray | memoryview, models: Iterable[type] | None = None) -> Any:
+    """Rebuild a parse result from :func:`dumps` output.
+
+    ``data`` may be any buffer, e.g. a ``memoryview`` over an ``mmap``; it is
+    read in place. When ``models`` is given (e.g. ``gwt_models.values()``),
+    only those classes are rebuilt and nothing is imported; otherwise any
+    importable pydantic model is accepted. ``data`` must come from a trusted
+    source either way.
+    """
+
+    with memoryview(data) as view:
+        return _Reader(view, models).read()
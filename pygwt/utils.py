@@ -1,5 +1,7 @@
 import json
 import re
+from importlib import import_module
+from importlib.metadata import entry_points
 from types import GenericAlias, UnionType
 from typing import get_args, get_origin
 
@@ -68,6 +70,23 @@ def separate_annotation(annotation: GenericAlias):
     return container, contained
 
 
+STATUS_OK = "//OK"
+STATUS_EX = "//EX"
+
+
+def peek_status(text: str) -> str:
+    """Return the ``//OK``/``//EX`` status of a raw response from its prefix only.
+
+    Raises:
+        ValueError: If ``text`` does not start with a known status.
+    """
+
+    status = text[:4]
+    if status != STATUS_OK and status != STATUS_EX:
+        raise ValueError(f"unknown GWT response status: {status!r}")
+    return status
+
+
 def gwt_splitter(text: str) -> tuple[str, list, list]:
     """Parse the raw HTTP response from GWT and return ``(status, codes, table)``."""
 
@@ -92,3 +111,29 @@ def get_pydantic_fields(model: type(BaseModel)):
         annotation = container[contained] if container else contained
         result[field] = annotation
     return result
+
+
+def import_object(spec: str):
+    """Import the object named by a ``"module:attribute"`` string.
+
+    Raises:
+        ValueError: If ``spec`` does not contain a ``:`` separator.
+    """
+
+    module_name, sep, attribute = spec.partition(":")
+    if not sep:
+        raise ValueError(f"expected 'module:attribute', got {spec!r}")
+    obj = import_module(module_name)
+    for part in attribute.split("."):
+        obj = getattr(obj, part)
+    return obj
+
+
+def entry_point_models(group: str) -> dict[str, str]:
+    """Return a lazy ``gwt_models`` mapping from an entry-point *group*.
+
+    Entry-point names are the Java class names and their values the
+    ``"module:Class"`` strings, imported only when a response uses them.
+    """
+
+    return {entry.name: entry.value for entry in entry_points(group=group)}
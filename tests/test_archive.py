@@ -0,0 +1,40 @@
+import tarfile
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from pygwt.archive import iter_members, parse_archive
+from pygwt.parser import GwtParser
+
+EXAMPLES = sorted((Path(__file__).parent / "gwt_examples" / "f29").glob("*.txt"))[:5]
+
+
+@pytest.fixture(params=["tar.gz", "tar.bz2", "zip"])
+def archive(request, tmp_path):
+    path = tmp_path / f"captures.{request.param}"
+    if request.param == "zip":
+        with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as archive:
+            for example in EXAMPLES:
+                archive.write(example, example.name)
+    else:
+        with tarfile.open(path, f"w:{request.param.split('.')[-1]}") as archive:
+            for example in EXAMPLES:
+                archive.add(example, example.name)
+    return path
+
+
+def test_parse_archive_keeps_member_names(archive, gwt_models):
+    results = dict(parse_archive(archive, gwt_models))
+    assert list(results) == [example.name for example in EXAMPLES]
+    for example in EXAMPLES:
+        expected = GwtParser(example.read_text(encoding="utf-8"), gwt_models).parse()
+        assert results[example.name] == expected
+
+
+def test_single_gzip_member(tmp_path):
+    import gzip
+
+    path = tmp_path / "response.txt.gz"
+    path.write_bytes(gzip.compress(EXAMPLES[0].read_bytes()))
+    assert list(iter_members(path)) == [("response.txt", EXAMPLES[0].read_bytes())]
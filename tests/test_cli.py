@@ -0,0 +1,76 @@
+import csv
+import json
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from pygwt.cli import main
+
+EXAMPLES = Path(__file__).parent / "gwt_examples" / "f3600"
+
+
+def test_decode_to_ndjson(tmp_path):
+    output = tmp_path / "out.ndjson"
+    code = main(["decode", str(EXAMPLES), "-m", "tests.conftest", "-o", str(output)])
+    lines = output.read_text(encoding="utf-8").splitlines()
+    assert code == 0
+    assert len(lines) == len(list(EXAMPLES.glob("*.txt")))
+    assert all(isinstance(json.loads(line)["result"], list) for line in lines)
+
+
+def test_decode_to_csv_in_parallel(tmp_path):
+    output = tmp_path / "out.csv"
+    code = main(["decode", str(EXAMPLES / "*.txt"), "-m", "tests.conftest", "-j", "2", "-o", str(output)])
+    assert code == 0
+    assert output.read_text(encoding="utf-8").startswith("source,")
+
+
+def test_decode_to_csv_splits_result_types(tmp_path):
+    inputs = [str(next((EXAMPLES.parent / name).glob("*.txt"))) for name in ("f29", "f50")]
+    output = tmp_path / "out.csv"
+    assert main(["decode", *inputs, "-m", "tests.conftest", "-o", str(output)]) == 0
+    with open(output, newline="", encoding="utf-8") as first, open(tmp_path / "out-2.csv", newline="", encoding="utf-8") as second:
+        first_rows, second_rows = list(csv.DictReader(first)), list(csv.DictReader(second))
+    assert {row["source"] for row in first_rows} == {inputs[0]}
+    assert {row["source"] for row in second_rows} == {inputs[1]}
+    assert set(first_rows[0]) != set(second_rows[0])
+
+
+def test_decode_to_csv_stdout_rejects_mixed_result_types():
+    inputs = [str(next((EXAMPLES.parent / name).glob("*.txt"))) for name in ("f29", "f50")]
+    with pytest.raises(SystemExit, match="single result type"):
+        main(["decode", *inputs, "-m", "tests.conftest", "-f", "csv"])
+
+
+def test_decode_reports_unmatched_pattern(tmp_path):
+    pattern = str(tmp_path / "nope" / "*.txt")
+    with pytest.raises(SystemExit, match=r"pygwt decode: no files match"):
+        main(["decode", pattern, "-o", str(tmp_path / "out.ndjson")])
+
+
+def test_decode_to_parquet_splits_result_types(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    output = tmp_path / "out.parquet"
+    assert main(["decode", str(EXAMPLES), "-m", "tests.conftest", "-o", str(output)]) == 0
+    tables = [pq.read_table(path) for path in sorted(tmp_path.glob("out*.parquet"))]
+    assert len(tables) > 1
+    assert len({tuple(table.column_names) for table in tables}) == len(tables)
+
+
+def test_decode_archive_members(tmp_path):
+    archive = tmp_path / "captures.zip"
+    with zipfile.ZipFile(archive, "w") as zf:
+        for example in EXAMPLES.glob("*.txt"):
+            zf.write(example, example.name)
+    output = tmp_path / "out.ndjson"
+    assert main(["decode", str(archive), "-m", "tests.conftest", "-o", str(output)]) == 0
+    sources = [json.loads(line)["source"] for line in output.read_text(encoding="utf-8").splitlines()]
+    assert sources[0].startswith(f"{archive}/")
+
+
+def test_cli_endpoints_match_gwt_codes():
+    from pygwt.cli import ENDPOINTS
+    from pygwt.gwt_codes import Endpoint
+
+    assert ENDPOINTS == tuple(e.value for e in Endpoint)
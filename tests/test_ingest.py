@@ -0,0 +1,134 @@
+import json
+import os
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from pygwt.ingest import _EVENT, IN_Q_OVERFLOW, Checkpoint, CheckpointError, DirectoryWatcher, Ingestor
+
+EXAMPLES = sorted((Path(__file__).parent / "gwt_examples" / "f3600").glob("*.txt"))
+
+
+def _sources(output):
+    return [json.loads(line)["source"] for line in output.read_text(encoding="utf-8").splitlines()]
+
+
+def _run_until(ingestor, condition, timeout=5.0):
+    stop = threading.Event()
+    thread = threading.Thread(target=ingestor.run, args=(stop,))
+    thread.start()
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    stop.set()
+    thread.join()
+    ingestor.close()
+
+
+@pytest.mark.parametrize("use_inotify", [True, False])
+def test_ingest_picks_up_new_files(tmp_path, use_inotify):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    shutil.copy(EXAMPLES[0], inbox)
+    output = tmp_path / "out.ndjson"
+    ingestor = Ingestor(inbox, output, tmp_path / "ckpt", models="tests.conftest",
+                        poll_interval=0.02, use_inotify=use_inotify)
+
+    def arrive():
+        time.sleep(0.05)
+        shutil.copy(EXAMPLES[1], inbox)
+
+    threading.Thread(target=arrive).start()
+    _run_until(ingestor, lambda: output.exists() and len(_sources(output)) == 2)
+    assert sorted(Path(s).name for s in _sources(output)) == [EXAMPLES[0].name, EXAMPLES[1].name]
+
+
+def test_ingest_resumes_from_checkpoint(tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    for example in EXAMPLES[:3]:
+        shutil.copy(example, inbox)
+    output, checkpoint = tmp_path / "out.ndjson", tmp_path / "ckpt"
+    _run_until(Ingestor(inbox, output, checkpoint, models="tests.conftest"), lambda: False, timeout=0.2)
+
+    # Simulate a crash after writing a record that never reached the checkpoint.
+    with open(output, "a", encoding="utf-8") as file:
+        file.write('{"source": "uncommitted"}\n')
+    shutil.copy(EXAMPLES[3], inbox)
+    _run_until(Ingestor(inbox, output, checkpoint, models="tests.conftest"), lambda: False, timeout=0.2)
+
+    sources = _sources(output)
+    assert len(sources) == len(set(sources)) == 4
+    assert "uncommitted" not in sources
+
+
+def test_ingest_resumes_after_crash_before_first_commit(tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    shutil.copy(EXAMPLES[0], inbox)
+    output, checkpoint = tmp_path / "out.ndjson", tmp_path / "ckpt"
+    output.write_text('{"source": "earlier run"}\n', encoding="utf-8")
+    Ingestor(inbox, output, checkpoint, models="tests.conftest").close()
+
+    # Simulate a crash after writing the first record but before its checkpoint line.
+    with open(output, "a", encoding="utf-8") as file:
+        file.write(json.dumps({"source": str(inbox / EXAMPLES[0].name)}) + "\n")
+    _run_until(Ingestor(inbox, output, checkpoint, models="tests.conftest"), lambda: False, timeout=0.2)
+
+    assert _sources(output) == ["earlier run", str(inbox / EXAMPLES[0].name)]
+
+
+def test_ingest_refuses_output_shorter_than_checkpoint(tmp_path):
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    shutil.copy(EXAMPLES[0], inbox)
+    output, checkpoint = tmp_path / "out.ndjson", tmp_path / "ckpt"
+    _run_until(Ingestor(inbox, output, checkpoint, models="tests.conftest"), lambda: output.exists() and output.stat().st_size)
+
+    output.write_bytes(b"")
+    with pytest.raises(CheckpointError, match="truncated or replaced"):
+        Ingestor(inbox, output, checkpoint)
+    assert output.read_bytes() == b""
+
+
+def test_checkpoint_drops_torn_line(tmp_path):
+    path = tmp_path / "ckpt"
+    path.write_bytes(b"100\ta\n200\tb")
+    checkpoint = Checkpoint(path, start=50)
+    assert (checkpoint.done, checkpoint.offset) == ({"a"}, 100)
+    checkpoint.commit("c", 300)
+    checkpoint.close()
+
+    reloaded = Checkpoint(path)
+    assert (reloaded.done, reloaded.offset) == ({"a", "c"}, 300)
+    reloaded.close()
+
+
+def test_checkpoint_starts_with_output_size(tmp_path):
+    path = tmp_path / "ckpt"
+    Checkpoint(path, start=42).close()
+    assert path.read_text(encoding="utf-8") == "42\t\n"
+
+    reloaded = Checkpoint(path, start=99)
+    assert (reloaded.done, reloaded.offset) == (set(), 42)
+    reloaded.close()
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+def test_watcher_rescans_after_inotify_overflow(tmp_path):
+    watcher = DirectoryWatcher(tmp_path, "*.txt", settle=0)
+    assert watcher.inotify is not None
+    # Replace the inotify descriptor with a pipe carrying a queue overflow event.
+    os.close(watcher.inotify.fd)
+    watcher.inotify.fd, write_end = os.pipe()
+    (tmp_path / "lost.txt").write_text("x", encoding="utf-8")
+    os.write(write_end, _EVENT.pack(-1, IN_Q_OVERFLOW, 0, 0))
+
+    assert watcher.poll(1.0) == [tmp_path / "lost.txt"]
+    assert watcher.poll(0) == []
+    watcher.close()
+    os.close(write_end)
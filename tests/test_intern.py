@@ -0,0 +1,42 @@
+from pathlib import Path
+
+import pytest
+
+from pygwt import models
+from pygwt.intern import InternPool, disable_interning, enable_interning
+from pygwt.parser import GwtParser
+
+
+@pytest.fixture
+def pool():
+    yield enable_interning()
+    disable_interning()
+
+
+def test_parsed_values_are_shared_across_responses(pool, gwt_models):
+    path = Path(__file__).parent / "gwt_examples" / "f29" / "20231121_132037530744.txt"
+    text = path.read_text(encoding="utf-8")
+    first = GwtParser(text, gwt_models).parse()
+    second = GwtParser(text, gwt_models).parse()
+    assert first == second
+    assert first[0].estado is second[0].estado
+    assert first[0].folio is second[0].folio
+    assert pool.hits
+
+
+def test_pool_is_bounded():
+    pool = InternPool(maxsize=2)
+    first = pool.intern_model(models.Long, {"raw": "A"})
+    pool.intern_model(models.Long, {"raw": "B"})
+    pool.intern_model(models.Long, {"raw": "C"})
+    assert len(pool) == 2
+    assert pool.intern_model(models.Long, {"raw": "A"}) is not first
+    assert pool.intern_strings(["", "", "x" * 100]) == ["", "", "x" * 100]
+
+
+def test_large_xml_is_not_pooled():
+    pool = InternPool(max_string_length=16)
+    raw = "<FormularioRfi>" + "x" * 100 + "</FormularioRfi>"
+    first = pool.intern_model(models.Xml, {"raw": raw})
+    assert pool.intern_model(models.Xml, {"raw": raw}) is not first
+    assert len(pool) == 0
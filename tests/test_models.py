@@ -1,3 +1,5 @@
+from xml.etree.ElementTree import XMLPullParser
+
 from pygwt import models
 
 
@@ -7,3 +9,38 @@ def test_long_value_is_int():
     long = models.Long(raw="xV3")  # arbitrary base64 number
     assert isinstance(long.value, int)
 
+
+def test_xml_form_fields():
+    """``XmlForm`` should unescape once and stream ``Codigos`` entries."""
+
+    codigos = "".join(
+        f"\\x3CCodigos\\x3E\\x3CCodigo\\x3E{code}\\x3C/Codigo\\x3E"
+        f"\\x3CValor\\x3E{value}\\x3C/Valor\\x3E\\x3C/Codigos\\x3E"
+        for code, value in [("01", "BERNER"), ("06", "Nº:1101"), ("91", "3146128")]
+    )
+    form = models.XmlForm(raw=f"\\x3CFormularioRfi\\x3E{codigos}\\x3C/FormularioRfi\\x3E")
+    assert form.value is form.value
+    assert form.fields() == {"01": "BERNER", "06": "Nº:1101", "91": "3146128"}
+    assert form.fields(["91"]) == {"91": "3146128"}
+
+
+def test_xml_form_iter_fields_drops_processed_elements(monkeypatch):
+    """Finished ``Codigos`` and header sections should not pile up under the root."""
+
+    roots = []
+
+    class RecordingParser(XMLPullParser):
+        def read_events(self):
+            for event, element in super().read_events():
+                if element.tag == "FormularioRfi" and not roots:
+                    roots.append(element)
+                yield event, element
+
+    monkeypatch.setattr(models, "XMLPullParser", RecordingParser)
+    monkeypatch.setattr(models.XmlForm, "chunk_size", 256)
+    header = "<Formulario><RutRol>1-9</RutRol></Formulario>"
+    codigos = "".join(f"<Codigos><Codigo>{i}</Codigo><Valor>v{i}</Valor></Codigos>" for i in range(1000))
+    fields = models.XmlForm(raw=f"<FormularioRfi>{header}{codigos}</FormularioRfi>").iter_fields()
+    assert [next(fields) for _ in range(500)][-1] == ("499", "v499")
+    assert len(roots[0]) < 10  # only entries from the chunk being read
+    assert len(list(fields)) == 500
@@ -0,0 +1,42 @@
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+from pygwt.parallel import parse_parallel, plan_segments
+from pygwt.parser import GwtParser
+from pygwt.replay import synthetic_response
+from pygwt.utils import gwt_splitter
+
+TABLE = '["java.util.Vector/3057315478","java.lang.Integer/3438268394"]'
+
+
+@pytest.fixture(scope="module")
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        yield executor
+
+
+def test_parse_parallel_matches_parse(gwt_file, gwt_models, executor):
+    text = Path(gwt_file).read_text(encoding="utf-8")
+    try:
+        expected = GwtParser(text, gwt_models).parse()
+    except Exception as exc:
+        with pytest.raises(type(exc)):
+            parse_parallel(text, gwt_models, executor=executor, min_codes=0)
+        return
+    assert parse_parallel(text, gwt_models, executor=executor, min_codes=0) == expected
+
+
+def test_back_references_keep_elements_together():
+    # Vector[10, <ref to the first Integer>, 20]
+    text = f"//OK[20,2,-2,10,2,3,1,{TABLE},0,7]"
+    segments = plan_segments(*gwt_splitter(text))
+    assert [segment.count for segment in segments] == [2, 1]
+    assert parse_parallel(text, min_codes=0, jobs=2) == [10, 10, 20]
+
+
+def test_parse_parallel_on_processes():
+    text = synthetic_response(5_000)
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        assert parse_parallel(text, executor=executor, min_codes=0) == GwtParser(text).parse()
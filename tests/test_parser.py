@@ -1,6 +1,10 @@
+import asyncio
 from pathlib import Path
 
-from pygwt.parser import GwtParser
+import pytest
+
+from pygwt import GwtRemoteException, peek_status
+from pygwt.parser import GwtParser, scan_codes
 
 
 def test_parse_examples(gwt_file, gwt_models):
@@ -16,3 +20,49 @@ def test_target_file_not_empty(target_file, gwt_models):
     result = parser.parse()
     assert isinstance(result, list)
     assert result, "expected at least one parsed item"
+
+
+def test_prescan_matches_full_history(gwt_file, gwt_models):
+    text = Path(gwt_file).read_text(encoding="utf-8")
+    expected = GwtParser(text, gwt_models).parse()
+    parser = GwtParser(text, gwt_models, prescan=True)
+    assert parser.parse() == expected
+    assert set(parser.history) <= parser.scan.references
+
+
+def test_prescan_accepts_negative_integers():
+    text = '//OK[-50,1,["java.lang.Integer/3438268394"],0,7]'
+    assert GwtParser(text, prescan=True).parse() == GwtParser(text).parse() == -50
+    assert scan_codes([-50, 1]).references == {49}
+
+
+def test_parse_raises_remote_exception():
+    text = (
+        '//EX[0,4,3,2,1,["java.lang.RuntimeException/515124647","outer",'
+        '"java.lang.IllegalStateException/1811975458","inner"],0,7]'
+    )
+    assert peek_status(text) == "//EX"
+    with pytest.raises(GwtRemoteException) as info:
+        GwtParser(text).parse()
+    outer, inner = info.value.chain()
+    assert (outer.java_class, outer.message) == ("java.lang.RuntimeException", "outer")
+    assert (inner.java_class, inner.message) == ("java.lang.IllegalStateException", "inner")
+
+
+def test_parse_async_matches_parse(gwt_file, gwt_models):
+    text = Path(gwt_file).read_text(encoding="utf-8")
+    expected = GwtParser(text, gwt_models).parse()
+    sliced = GwtParser(text, gwt_models).parse_async(budget_ms=0)
+    offloaded = GwtParser(text, gwt_models).parse_async(offload_threshold=0)
+    assert asyncio.run(sliced) == expected
+    assert asyncio.run(offloaded) == expected
+
+
+def test_lazy_model_registry(gwt_models):
+    path = Path(__file__).parent / "gwt_examples" / "f29" / "20231121_132037530744.txt"
+    text = path.read_text(encoding="utf-8")
+    expected = GwtParser(text, gwt_models).parse()
+    lazy = {name: f"{model.__module__}:{model.__qualname__}" for name, model in gwt_models.items()}
+    parser = GwtParser(text, lazy)
+    assert parser.parse() == expected
+    assert parser.gwt_models["FolioPeriodoFormularioTO"] is gwt_models["FolioPeriodoFormularioTO"]
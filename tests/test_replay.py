@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import requests
+
+from pygwt.gwt_codes import Endpoint, Rfi, SifmConsulta
+from pygwt.parser import GwtParser
+from pygwt.replay import PERMUTATION, STRONG_NAME, ReplayServer, run_load, synthetic_response
+
+EXAMPLES = Path(__file__).parent / "gwt_examples" / "f3600"
+
+
+def test_synthetic_response_size():
+    assert len(GwtParser(synthetic_response(25)).parse()) == 25
+
+
+def test_gwt_codes_against_replay_server():
+    with ReplayServer() as server:
+        for codes in (SifmConsulta(base_url=server.url), Rfi(base_url=server.url)):
+            assert codes.gwt_permutation == PERMUTATION
+            assert codes.strong_name == STRONG_NAME
+
+
+def test_replay_injects_errors():
+    with ReplayServer(error_rate=1.0, seed=1) as server:
+        response = requests.post(f"{server.url}/rfiInternet/rfi/", data=b"")
+    assert response.text.startswith("//EX")
+
+
+def test_run_load_reports_latency(gwt_models):
+    with ReplayServer(EXAMPLES, latency_ms=1, seed=0) as server:
+        report = run_load(server.url, Endpoint.sifm_consulta, requests_total=40, concurrency=4, gwt_models=gwt_models)
+    assert report.errors == 0
+    assert len(report.latencies) == 40
+    assert 0 < report.percentile(0.5) <= report.percentile(0.99)
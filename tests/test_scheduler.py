@@ -0,0 +1,124 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from pygwt.gwt_codes import Endpoint
+from pygwt.scheduler import AdaptiveConcurrency, Priority, RequestScheduler, TokenBucket
+
+
+class ThrottlingStub:
+    """Local stand-in for the service that answers 429 above ``capacity`` concurrent calls."""
+
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.in_flight = 0
+        self.throttled = 0
+        self.lock = threading.Lock()
+
+    def __call__(self, endpoint, payload):
+        with self.lock:
+            self.in_flight += 1
+            busy = self.in_flight > self.capacity
+            self.throttled += busy
+        time.sleep(0.005)
+        with self.lock:
+            self.in_flight -= 1
+        if busy:
+            return SimpleNamespace(status_code=429, text="")
+        return SimpleNamespace(status_code=200, text=f"//OK[{payload}]")
+
+
+def test_token_bucket_paces_calls():
+    now = [0.0]
+    bucket = TokenBucket(rate=2, capacity=1, clock=lambda: now[0])
+    assert bucket.try_acquire() == 0
+    assert bucket.try_acquire() == 0.5
+    now[0] += 0.5
+    assert bucket.try_acquire() == 0
+
+
+def test_scheduler_backs_off_under_throttling():
+    stub = ThrottlingStub(capacity=2)
+    concurrency = AdaptiveConcurrency(initial=8, maximum=8)
+    with RequestScheduler(stub, {Endpoint.rfi: 1000}, concurrency=concurrency, max_retries=10, retry_delay=0.001) as scheduler:
+        futures = [scheduler.submit(Endpoint.rfi, i) for i in range(40)]
+        responses = [future.result() for future in futures]
+    assert [response.text for response in responses] == [f"//OK[{i}]" for i in range(40)]
+    assert stub.throttled
+    assert concurrency.limit < 8
+
+
+def test_scheduler_prefers_interactive_calls():
+    order = []
+    gate = threading.Event()
+
+    def send(endpoint, payload):
+        gate.wait()
+        order.append(payload)
+        return SimpleNamespace(status_code=200, text="//OK[]")
+
+    with RequestScheduler(send, default_rate=1000, workers=1) as scheduler:
+        scheduler.submit(Endpoint.sifm_consulta, "first")
+        time.sleep(0.01)
+        scheduler.submit(Endpoint.sifm_consulta, "batch")
+        scheduler.submit(Endpoint.sifm_consulta, "interactive", Priority.INTERACTIVE)
+        gate.set()
+    assert order == ["first", "interactive", "batch"]
+
+
+def test_scheduler_refreshes_stale_codes():
+    codes = SimpleNamespace(updates=0)
+    codes.update = lambda: setattr(codes, "updates", codes.updates + 1)
+    replies = iter(["//EX[2,1,[\"...IncompatibleRemoteServiceException/3936916533\",\"\"],0,7]", "//OK[]"])
+
+    def send(endpoint, payload):
+        return SimpleNamespace(status_code=200, text=next(replies))
+
+    with RequestScheduler(send, default_rate=1000, workers=1, codes={Endpoint.rfi: codes}) as scheduler:
+        assert scheduler.submit(Endpoint.rfi, None).result().text == "//OK[]"
+    assert codes.updates == 1
+
+
+def test_scheduler_survives_failed_refresh():
+    def update():
+        raise ConnectionError("sii.cl unreachable")
+
+    codes = SimpleNamespace(updated_at=0.0, update=update)
+    stale = "//EX[2,1,[\"...IncompatibleRemoteServiceException/3936916533\",\"\"],0,7]"
+
+    def send(endpoint, payload):
+        return SimpleNamespace(status_code=200, text=stale if payload == "stale" else "//OK[]")
+
+    with RequestScheduler(send, default_rate=1000, workers=1, codes={Endpoint.rfi: codes}) as scheduler:
+        failed = scheduler.submit(Endpoint.rfi, "stale")
+        with pytest.raises(ConnectionError):
+            failed.result(timeout=3)
+        assert scheduler.submit(Endpoint.rfi, "ok").result(timeout=3).text == "//OK[]"
+
+
+def test_scheduler_refreshes_once_per_burst():
+    codes = SimpleNamespace(updated_at=0.0, updates=0)
+
+    def update():
+        time.sleep(0.02)
+        codes.updates += 1
+        codes.updated_at = time.time()
+
+    codes.update = update
+    stale = "//EX[2,1,[\"...IncompatibleRemoteServiceException/3936916533\",\"\"],0,7]"
+    barrier = threading.Barrier(4)
+
+    def send(endpoint, payload):
+        if codes.updates:
+            return SimpleNamespace(status_code=200, text="//OK[]")
+        barrier.wait(timeout=3)
+        return SimpleNamespace(status_code=200, text=stale)
+
+    concurrency = AdaptiveConcurrency(initial=4, maximum=4)
+    with RequestScheduler(send, default_rate=1000, workers=4, concurrency=concurrency,
+                          codes={Endpoint.rfi: codes}) as scheduler:
+        futures = [scheduler.submit(Endpoint.rfi, i) for i in range(4)]
+        assert all(future.result(timeout=3).text == "//OK[]" for future in futures)
+    assert codes.updates == 1
@@ -0,0 +1,36 @@
+from pathlib import Path
+
+import pytest
+
+from pygwt import models, snapshot
+from pygwt.parser import GwtParser
+
+
+def test_snapshot_roundtrip(gwt_file, gwt_models):
+    text = Path(gwt_file).read_text(encoding="utf-8")
+    result = GwtParser(text, gwt_models).parse()
+    assert snapshot.loads(memoryview(snapshot.dumps(result))) == result
+
+
+def test_snapshot_keeps_shared_references():
+    long = models.Long(raw="xV3")
+    data = snapshot.dumps([long, long, "CLP", "CLP", -7, 1.5, None])
+    first, second, currency, *rest = snapshot.loads(data)
+    assert first is second
+    assert first.value == long.value
+    assert data.count(b"CLP") == 1
+    assert [currency, *rest] == ["CLP", "CLP", -7, 1.5, None]
+
+
+def test_snapshot_rejects_non_models():
+    name = b"subprocess:Popen"
+    data = snapshot.MAGIC + bytes([snapshot.VERSION, 1, len(name)]) + name + bytes([snapshot.MODEL, 0])
+    with pytest.raises(ValueError, match="not a pydantic model"):
+        snapshot.loads(data)
+
+
+def test_snapshot_allow_list():
+    data = snapshot.dumps([models.Long(raw="xV3")])
+    assert snapshot.loads(data, models=[models.Long]) == [models.Long(raw="xV3")]
+    with pytest.raises(ValueError, match="not allowed"):
+        snapshot.loads(data, models=[models.Bool])
@@ -1,6 +1,6 @@
 import pytest
 
-from pygwt.utils import encoder, decoder
+from pygwt.utils import encoder, decoder, peek_status
 
 
 def test_encoder_decoder_roundtrip():
@@ -22,3 +22,9 @@ def test_decoder_invalid_char():
 def test_decoder_empty_string():
     with pytest.raises(ValueError):
         decoder("")
+
+
+def test_peek_status():
+    assert peek_status("//OK[0,1,[],0,7]") == "//OK"
+    with pytest.raises(ValueError):
+        peek_status("<html>")